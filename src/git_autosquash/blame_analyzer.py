@@ -30,7 +30,7 @@ class TargetingMethod(Enum):
 BlameInfo = BatchBlameInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class HunkTargetMapping:
     """Maps a hunk to its target commit for squashing."""
 
@@ -12,6 +12,9 @@ from git_autosquash.git_worktree_handler import GitWorktreeIgnoreHandler
 
 StrategyType = Literal["worktree", "index", "legacy"]
 
+# Sentinel distinguishing "not cached" from a cached None/False result
+_MISSING = object()
+
 
 class CapabilityCache:
     """Cache for git capability detection to avoid repeated command execution."""
@@ -23,6 +26,10 @@ class CapabilityCache:
         """Get cached capability result."""
         return self._cache.get(key)
 
+    def get_or_missing(self, key: str) -> Any:
+        """Get cached capability result, or _MISSING if not cached."""
+        return self._cache.get(key, _MISSING)
+
     def set(self, key: str, value: Any) -> None:
         """Set cached capability result."""
         self._cache[key] = value
@@ -146,8 +153,8 @@ class GitNativeCompleteHandler:
         cache_key = "worktree_support"
 
         # Check cache first
-        if self.capability_cache.has(cache_key):
-            cached_result = self.capability_cache.get(cache_key)
+        cached_result = self.capability_cache.get_or_missing(cache_key)
+        if cached_result is not _MISSING:
             self.logger.debug(f"Using cached worktree support result: {cached_result}")
             return bool(cached_result)
 
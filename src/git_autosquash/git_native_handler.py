@@ -1,11 +1,57 @@
 """Git-native handler for ignore functionality using hybrid stash approach."""
 
 import logging
-from pathlib import Path
-from typing import List, Optional
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional
 
+from git_autosquash.hunk_parser import DiffHunk
 from git_autosquash.hunk_target_resolver import HunkTargetMapping
 from git_autosquash.git_ops import GitOps
+from git_autosquash.path_validation import RepoRootResolver, validate_hunk_paths
+
+
+def create_combined_patch(
+    hunks: Iterable[DiffHunk],
+    blob_info_for: Optional[Callable[[str], Dict[str, str]]] = None,
+) -> str:
+    """Create a single git patch covering several hunks.
+
+    Hunks are grouped under one diff header per file, in their original
+    order. When blob_info_for is given, each file header also gets an index
+    line built from its result, so blob info is looked up once per file.
+
+    Args:
+        hunks: DiffHunk objects to include in the patch
+        blob_info_for: Optional lookup returning old_hash, new_hash and mode
+            for a file path
+
+    Returns:
+        Patch content string, empty if there are no hunks
+    """
+    hunks_by_file: Dict[str, List[DiffHunk]] = defaultdict(list)
+    for hunk in hunks:
+        hunks_by_file[hunk.file_path].append(hunk)
+
+    patch_lines: List[str] = []
+    for file_path, file_hunks in hunks_by_file.items():
+        patch_lines.append(f"diff --git a/{file_path} b/{file_path}")
+        if blob_info_for is not None:
+            blob_info = blob_info_for(file_path)
+            patch_lines.append(
+                f"index {blob_info['old_hash']}..{blob_info['new_hash']} "
+                f"{blob_info['mode']}"
+            )
+        patch_lines.append(f"--- a/{file_path}")
+        patch_lines.append(f"+++ b/{file_path}")
+
+        # Add hunk content
+        for hunk in file_hunks:
+            patch_lines.extend(hunk.lines)
+
+    if not patch_lines:
+        return ""
+
+    return "\n".join(patch_lines) + "\n"
 
 
 class GitNativeIgnoreHandler:
@@ -23,6 +69,8 @@ class GitNativeIgnoreHandler:
         """
         self.git_ops = git_ops
         self.logger = logging.getLogger(__name__)
+        # (repo_path, resolved root) from the last path validation
+        self._repo_root = RepoRootResolver()
 
     def apply_ignored_hunks(self, ignored_mappings: List[HunkTargetMapping]) -> bool:
         """Apply ignored hunks with native git backup/restore.
@@ -106,6 +154,14 @@ class GitNativeIgnoreHandler:
             self.logger.error(f"Failed to create backup stash: {stash_output}")
             return None
 
+    def _get_repo_root(self) -> str:
+        """Resolve the repository root, reusing the result while repo_path is unchanged.
+
+        Returns:
+            Resolved repository root directory
+        """
+        return self._repo_root.resolve(self.git_ops.repo_path)
+
     def _validate_file_paths(self, ignored_mappings: List[HunkTargetMapping]) -> bool:
         """Enhanced path validation to prevent security issues.
 
@@ -116,37 +172,14 @@ class GitNativeIgnoreHandler:
             True if all paths are safe, False otherwise
         """
         try:
-            repo_root = Path(self.git_ops.repo_path).resolve()
-
-            for mapping in ignored_mappings:
-                file_path = Path(mapping.hunk.file_path)
-
-                # Reject absolute paths
-                if file_path.is_absolute():
-                    self.logger.error(
-                        f"Absolute file path not allowed: {mapping.hunk.file_path}"
-                    )
-                    return False
+            repo_root = self._get_repo_root()
 
-                # Check for symlinks in path components (security)
-                current_path = repo_root
-                for part in file_path.parts:
-                    current_path = current_path / part
-                    if current_path.is_symlink():
-                        self.logger.error(
-                            f"Symlinks not allowed in file paths: {mapping.hunk.file_path}"
-                        )
-                        return False
-
-                # Check for path traversal by resolving against repo root
-                resolved_path = (repo_root / file_path).resolve()
-                try:
-                    resolved_path.relative_to(repo_root)
-                except ValueError:
-                    self.logger.error(
-                        f"Path traversal detected: {mapping.hunk.file_path}"
-                    )
-                    return False
+            error = validate_hunk_paths(
+                repo_root, (mapping.hunk.file_path for mapping in ignored_mappings)
+            )
+            if error is not None:
+                self.logger.error(error)
+                return False
 
             self.logger.debug("All file paths validated successfully")
             return True
@@ -180,8 +213,8 @@ class GitNativeIgnoreHandler:
         """Apply patches using git index manipulation for precise control.
 
         This method leverages git's native index operations:
-        1. Create temporary patches for each hunk
-        2. Stage hunks individually to the index
+        1. Create one combined patch covering every hunk
+        2. Stage all hunks to the index in a single git apply --cached
         3. Generate final patch using git diff --cached
         4. Reset index and apply to working tree
 
@@ -199,13 +232,11 @@ class GitNativeIgnoreHandler:
                 return False
 
             try:
-                # Apply each hunk to index individually for validation
-                for mapping in ignored_mappings:
-                    if not self._stage_hunk_to_index(mapping.hunk):
-                        self.logger.error(
-                            f"Failed to stage hunk for {mapping.hunk.file_path}"
-                        )
-                        return False
+                # Stage all hunks to index at once for validation
+                hunks = [mapping.hunk for mapping in ignored_mappings]
+                if not self._stage_hunks_to_index(hunks):
+                    self.logger.error("Failed to stage hunks to index")
+                    return False
 
                 # Generate patch from staged changes
                 patch_content = self._generate_patch_from_index()
@@ -290,69 +321,40 @@ class GitNativeIgnoreHandler:
             self.logger.error(f"Error restoring index state: {e}")
             return False
 
-    def _stage_hunk_to_index(self, hunk) -> bool:
-        """Stage a specific hunk to the git index using patch application.
+    def _stage_hunks_to_index(self, hunks) -> bool:
+        """Stage hunks to the git index with a single patch application.
 
         Args:
-            hunk: DiffHunk object to stage
+            hunks: DiffHunk objects to stage
 
         Returns:
-            True if hunk was staged successfully
+            True if all hunks were staged successfully
         """
         try:
-            # Create a minimal patch for this single hunk
-            hunk_patch = self._create_minimal_patch_for_hunk(hunk)
-            if not hunk_patch:
+            # Create one patch covering every hunk
+            combined_patch = create_combined_patch(hunks, self._get_file_blob_info)
+            if not combined_patch:
                 return False
 
             # Apply patch to index only (--cached)
             success, error_msg = self.git_ops._run_git_command_with_input(
-                "apply", "--cached", input_text=hunk_patch
+                "apply", "--cached", input_text=combined_patch
             )
 
             if success:
-                self.logger.debug(f"Staged hunk for {hunk.file_path} to index")
+                self.logger.debug(f"Staged {len(hunks)} hunks to index")
                 return True
             else:
+                file_paths = ", ".join(dict.fromkeys(hunk.file_path for hunk in hunks))
                 self.logger.warning(
-                    f"Failed to stage hunk for {hunk.file_path}: {error_msg}"
+                    f"Failed to stage hunks for {file_paths}: {error_msg}"
                 )
                 return False
 
         except Exception as e:
-            self.logger.error(f"Error staging hunk to index: {e}")
+            self.logger.error(f"Error staging hunks to index: {e}")
             return False
 
-    def _create_minimal_patch_for_hunk(self, hunk) -> Optional[str]:
-        """Create a minimal git patch for a single hunk.
-
-        Args:
-            hunk: DiffHunk object to create patch for
-
-        Returns:
-            Patch content string, or None if creation failed
-        """
-        try:
-            # Get blob info for proper headers
-            blob_info = self._get_file_blob_info(hunk.file_path)
-
-            # Build minimal patch
-            patch_lines = [
-                f"diff --git a/{hunk.file_path} b/{hunk.file_path}",
-                f"index {blob_info['old_hash']}..{blob_info['new_hash']} {blob_info['mode']}",
-                f"--- a/{hunk.file_path}",
-                f"+++ b/{hunk.file_path}",
-            ]
-
-            # Add hunk content
-            patch_lines.extend(hunk.lines)
-
-            return "\n".join(patch_lines) + "\n"
-
-        except Exception as e:
-            self.logger.error(f"Failed to create minimal patch for hunk: {e}")
-            return None
-
     def _generate_patch_from_index(self) -> Optional[str]:
         """Generate a patch from currently staged changes using git diff --cached.
 
@@ -7,6 +7,7 @@ from typing import List, Optional
 
 from git_autosquash.hunk_target_resolver import HunkTargetMapping
 from git_autosquash.git_ops import GitOps
+from git_autosquash.path_validation import RepoRootResolver, validate_hunk_paths
 from git_autosquash.result import StrategyResult, StrategyExecutionError, Ok, Err
 from git_autosquash.resource_managers import git_state_context, worktree_context
 
@@ -29,6 +30,8 @@ class GitWorktreeIgnoreHandler:
         """
         self.git_ops = git_ops
         self.logger = logging.getLogger(__name__)
+        # (repo_path, resolved root) from the last path validation
+        self._repo_root = RepoRootResolver()
 
     def apply_ignored_hunks_enhanced(
         self, ignored_mappings: List[HunkTargetMapping]
@@ -636,6 +639,14 @@ git diff HEAD
         else:
             self.logger.warning(f"Failed to clean up stash {stash_ref}: {output}")
 
+    def _get_repo_root(self) -> str:
+        """Resolve the repository root, reusing the result while repo_path is unchanged.
+
+        Returns:
+            Resolved repository root directory
+        """
+        return self._repo_root.resolve(self.git_ops.repo_path)
+
     def _validate_file_paths(self, ignored_mappings: List[HunkTargetMapping]) -> bool:
         """Enhanced path validation to prevent security issues.
 
@@ -646,37 +657,14 @@ git diff HEAD
             True if all paths are safe, False otherwise
         """
         try:
-            repo_root = Path(self.git_ops.repo_path).resolve()
-
-            for mapping in ignored_mappings:
-                file_path = Path(mapping.hunk.file_path)
-
-                # Reject absolute paths
-                if file_path.is_absolute():
-                    self.logger.error(
-                        f"Absolute file path not allowed: {mapping.hunk.file_path}"
-                    )
-                    return False
-
-                # Check for symlinks in path components (security)
-                current_path = repo_root
-                for part in file_path.parts:
-                    current_path = current_path / part
-                    if current_path.is_symlink():
-                        self.logger.error(
-                            f"Symlinks not allowed in file paths: {mapping.hunk.file_path}"
-                        )
-                        return False
+            repo_root = self._get_repo_root()
 
-                # Check for path traversal by resolving against repo root
-                resolved_path = (repo_root / file_path).resolve()
-                try:
-                    resolved_path.relative_to(repo_root)
-                except ValueError:
-                    self.logger.error(
-                        f"Path traversal detected: {mapping.hunk.file_path}"
-                    )
-                    return False
+            error = validate_hunk_paths(
+                repo_root, (mapping.hunk.file_path for mapping in ignored_mappings)
+            )
+            if error is not None:
+                self.logger.error(error)
+                return False
 
             self.logger.debug("All file paths validated successfully")
             return True
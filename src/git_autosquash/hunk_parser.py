@@ -7,7 +7,7 @@ from typing import List
 from git_autosquash.git_ops import GitOps
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffHunk:
     """Represents a single diff hunk with metadata."""
 
@@ -30,7 +30,7 @@ class BlameInfo:
     line_content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class HunkTargetMapping:
     """Maps a hunk to its target commit for squashing."""
 
@@ -143,6 +143,9 @@ def _apply_ignored_hunks(ignored_mappings, git_ops) -> bool:
     Returns:
         True if successful, False if any hunks could not be applied
     """
+    if not ignored_mappings:
+        return True
+
     from git_autosquash.git_native_complete_handler import create_git_native_handler
 
     handler = create_git_native_handler(git_ops)
@@ -0,0 +1,94 @@
+"""Validation of hunk file paths against the repository root."""
+
+import os
+import re
+import stat
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+
+# Absolute paths and any ".." path component. Git never emits either in diff
+# paths, so these can be rejected without touching disk. A drive letter only
+# makes a path absolute on Windows; elsewhere "c:notes" is a valid file name.
+_ABSOLUTE_PATTERN = r"^[\\/]|^[A-Za-z]:" if os.name == "nt" else r"^[\\/]"
+_UNSAFE_PATH_RE = re.compile(
+    rf"(?P<absolute>{_ABSOLUTE_PATTERN})|(?P<traversal>(?:^|[\\/])\.\.(?:[\\/]|$))"
+)
+
+
+def validate_hunk_path(repo_root: str, file_path: str) -> Optional[str]:
+    """Check that a hunk file path stays inside the repository.
+
+    Absolute paths and ".." components are rejected up front by a regex.
+    What remains is a relative path that cannot climb out of repo_root
+    lexically, so only its components need checking for symlinks with lstat.
+    Nothing is cached, so a component that has since become a symlink is
+    still caught.
+
+    Args:
+        repo_root: Resolved repository root directory
+        file_path: File path from the hunk, relative to the repository root
+
+    Returns:
+        None if the path is safe, otherwise a description of the violation
+    """
+    # Reject obviously unsafe paths before any filesystem access
+    match = _UNSAFE_PATH_RE.search(file_path)
+    if match is not None:
+        if match.group("absolute"):
+            return f"Absolute file path not allowed: {file_path}"
+        return f"Path traversal detected: {file_path}"
+
+    # Check for symlinks in path components (security). lstat does not follow
+    # links, and once a component is missing nothing below it can exist.
+    current_path = repo_root
+    for part in Path(file_path).parts:
+        current_path = os.path.join(current_path, part)
+        try:
+            mode = os.lstat(current_path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            break
+        if stat.S_ISLNK(mode):
+            return f"Symlinks not allowed in file paths: {file_path}"
+
+    return None
+
+
+def validate_hunk_paths(repo_root: str, file_paths: Iterable[str]) -> Optional[str]:
+    """Validate several hunk file paths, checking each distinct path once.
+
+    Args:
+        repo_root: Resolved repository root directory
+        file_paths: File paths from the hunks, relative to the repository root
+
+    Returns:
+        None if every path is safe, otherwise the first violation found
+    """
+    for file_path in dict.fromkeys(file_paths):
+        error = validate_hunk_path(repo_root, file_path)
+        if error is not None:
+            return error
+    return None
+
+
+class RepoRootResolver:
+    """Resolves a repository root, reusing the result while the path is unchanged."""
+
+    def __init__(self) -> None:
+        """Initialize with nothing resolved yet."""
+        self._resolved: Optional[Tuple[Path, str]] = None
+
+    def resolve(self, repo_path: Path) -> str:
+        """Resolve repo_path, re-resolving only when it differs from the last call.
+
+        Args:
+            repo_path: Repository path as held by GitOps
+
+        Returns:
+            Resolved repository root directory
+        """
+        cached = self._resolved
+        if cached is None or cached[0] != repo_path:
+            cached = (repo_path, str(Path(repo_path).resolve()))
+            self._resolved = cached
+        return cached[1]
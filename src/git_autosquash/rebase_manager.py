@@ -3,6 +3,7 @@
 import os
 import subprocess
 import tempfile
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Set
 
 from git_autosquash.hunk_target_resolver import HunkTargetMapping
@@ -255,12 +256,7 @@ class RebaseManager:
         """
         print(f"DEBUG: Starting direct application of {len(hunks)} hunks")
 
-        # Group hunks by file
-        files_to_hunks: Dict[str, List[DiffHunk]] = {}
-        for hunk in hunks:
-            if hunk.file_path not in files_to_hunks:
-                files_to_hunks[hunk.file_path] = []
-            files_to_hunks[hunk.file_path].append(hunk)
+        files_to_hunks = self._consolidate_hunks_by_file(hunks)
 
         for file_path, file_hunks in files_to_hunks.items():
             print(f"DEBUG: Processing file {file_path} with {len(file_hunks)} hunks")
@@ -346,12 +342,10 @@ class RebaseManager:
         self, hunks: List[DiffHunk]
     ) -> Dict[str, List[DiffHunk]]:
         """Group hunks by file and detect potential conflicts."""
-        files_to_hunks: Dict[str, List[DiffHunk]] = {}
+        files_to_hunks: Dict[str, List[DiffHunk]] = defaultdict(list)
         for hunk in hunks:
-            if hunk.file_path not in files_to_hunks:
-                files_to_hunks[hunk.file_path] = []
             files_to_hunks[hunk.file_path].append(hunk)
-        return files_to_hunks
+        return dict(files_to_hunks)
 
     def _extract_hunk_changes(self, hunk: DiffHunk) -> List[Dict]:
         """Extract all changes from a hunk, handling multiple changes per hunk.
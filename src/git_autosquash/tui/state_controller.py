@@ -5,7 +5,7 @@ scattered across widgets and screens, providing a single source of truth
 for hunk approval and ignore states.
 """
 
-from typing import Dict, List, Set
+from typing import Dict, List
 
 from git_autosquash.hunk_target_resolver import HunkTargetMapping
 
@@ -28,9 +28,14 @@ class UIStateController:
         """
         self.mappings = mappings
 
-        # Core state storage - using sets of indices for O(1) lookups
-        self._approved: Set[int] = set()
-        self._ignored: Set[int] = set()
+        # Core state storage - one byte per mapping index for O(1) lookups
+        # in a single contiguous allocation
+        self._approved = bytearray(len(mappings))
+        self._ignored = bytearray(len(mappings))
+
+        # Running counts kept in step with the masks for O(1) statistics
+        self._approved_count = 0
+        self._ignored_count = 0
 
         # O(1) index lookup for mappings
         self._mapping_to_index: Dict[int, int] = {
@@ -47,7 +52,7 @@ class UIStateController:
             True if approved, False otherwise
         """
         index = self._mapping_to_index.get(id(mapping))
-        return index is not None and index in self._approved
+        return index is not None and self._approved[index] == 1
 
     def is_ignored(self, mapping: HunkTargetMapping) -> bool:
         """Check if a hunk is ignored (kept in working tree).
@@ -59,7 +64,7 @@ class UIStateController:
             True if ignored, False otherwise
         """
         index = self._mapping_to_index.get(id(mapping))
-        return index is not None and index in self._ignored
+        return index is not None and self._ignored[index] == 1
 
     def set_approved(self, mapping: HunkTargetMapping, approved: bool) -> None:
         """Set the approval state for a hunk.
@@ -70,10 +75,8 @@ class UIStateController:
         """
         index = self._mapping_to_index.get(id(mapping))
         if index is not None:
-            if approved:
-                self._approved.add(index)
-            else:
-                self._approved.discard(index)
+            self._approved_count += approved - self._approved[index]
+            self._approved[index] = approved
 
     def set_ignored(self, mapping: HunkTargetMapping, ignored: bool) -> None:
         """Set the ignore state for a hunk.
@@ -84,10 +87,8 @@ class UIStateController:
         """
         index = self._mapping_to_index.get(id(mapping))
         if index is not None:
-            if ignored:
-                self._ignored.add(index)
-            else:
-                self._ignored.discard(index)
+            self._ignored_count += ignored - self._ignored[index]
+            self._ignored[index] = ignored
 
     def toggle_approved(self, mapping: HunkTargetMapping) -> bool:
         """Toggle the approval state for a hunk.
@@ -104,27 +105,33 @@ class UIStateController:
 
     def approve_all(self) -> None:
         """Approve all hunks and clear ignore states."""
-        self._approved = set(range(len(self.mappings)))
-        self._ignored.clear()
+        self._approved[:] = b"\x01" * len(self.mappings)
+        self._ignored[:] = bytes(len(self.mappings))
+        self._approved_count = len(self.mappings)
+        self._ignored_count = 0
 
     def approve_all_toggle(self) -> None:
         """Toggle approval for all hunks (if all approved, unapprove all; otherwise approve all)."""
-        if len(self._approved) == len(self.mappings):
+        if self._approved_count == len(self.mappings):
             # All approved, clear approvals
-            self._approved.clear()
+            self._approved[:] = bytes(len(self.mappings))
+            self._approved_count = 0
         else:
             # Not all approved, approve all
             self.approve_all()
 
     def ignore_all_toggle(self) -> None:
         """Toggle ignore for all hunks (if all ignored, unignore all; otherwise ignore all)."""
-        if len(self._ignored) == len(self.mappings):
+        if self._ignored_count == len(self.mappings):
             # All ignored, clear ignores
-            self._ignored.clear()
+            self._ignored[:] = bytes(len(self.mappings))
+            self._ignored_count = 0
         else:
             # Not all ignored, ignore all and clear approvals
-            self._ignored = set(range(len(self.mappings)))
-            self._approved.clear()
+            self._ignored[:] = b"\x01" * len(self.mappings)
+            self._approved[:] = bytes(len(self.mappings))
+            self._ignored_count = len(self.mappings)
+            self._approved_count = 0
 
     def get_approved_mappings(self) -> List[HunkTargetMapping]:
         """Get list of approved mappings.
@@ -132,7 +139,11 @@ class UIStateController:
         Returns:
             List of mappings approved for squashing
         """
-        return [self.mappings[i] for i in self._approved]
+        return [
+            mapping
+            for mapping, approved in zip(self.mappings, self._approved)
+            if approved
+        ]
 
     def get_ignored_mappings(self) -> List[HunkTargetMapping]:
         """Get list of ignored mappings.
@@ -140,7 +151,9 @@ class UIStateController:
         Returns:
             List of mappings to be ignored (kept in working tree)
         """
-        return [self.mappings[i] for i in self._ignored]
+        return [
+            mapping for mapping, ignored in zip(self.mappings, self._ignored) if ignored
+        ]
 
     def get_progress_stats(self) -> Dict[str, int]:
         """Get current progress statistics.
@@ -149,9 +162,9 @@ class UIStateController:
             Dictionary with counts for approved, ignored, total, and selected
         """
         return {
-            "approved": len(self._approved),
-            "ignored": len(self._ignored),
-            "selected": len(self._approved) + len(self._ignored),
+            "approved": self._approved_count,
+            "ignored": self._ignored_count,
+            "selected": self._approved_count + self._ignored_count,
             "total": len(self.mappings),
         }
 
@@ -161,7 +174,7 @@ class UIStateController:
         Returns:
             True if any hunks are approved or ignored
         """
-        return len(self._approved) > 0 or len(self._ignored) > 0
+        return self._approved_count > 0 or self._ignored_count > 0
 
     def get_mapping_index(self, mapping: HunkTargetMapping) -> int:
         """Get the index of a mapping in the original list.
@@ -196,5 +209,7 @@ class UIStateController:
 
     def clear_all(self) -> None:
         """Clear all approval and ignore states."""
-        self._approved.clear()
-        self._ignored.clear()
+        self._approved[:] = bytes(len(self.mappings))
+        self._ignored[:] = bytes(len(self.mappings))
+        self._approved_count = 0
+        self._ignored_count = 0
@@ -15,6 +15,41 @@ from textual.widgets import Checkbox, Static
 from git_autosquash.hunk_target_resolver import HunkTargetMapping
 from git_autosquash.hunk_parser import DiffHunk
 
+# File extension to syntax highlighting language, used by DiffViewer
+_LANGUAGE_BY_EXTENSION = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "jsx": "jsx",
+    "tsx": "tsx",
+    "java": "java",
+    "c": "c",
+    "cpp": "cpp",
+    "cc": "cpp",
+    "h": "c",
+    "hpp": "cpp",
+    "rs": "rust",
+    "go": "go",
+    "rb": "ruby",
+    "php": "php",
+    "sh": "bash",
+    "bash": "bash",
+    "zsh": "bash",
+    "fish": "bash",
+    "ps1": "powershell",
+    "html": "html",
+    "css": "css",
+    "scss": "scss",
+    "sass": "sass",
+    "less": "less",
+    "json": "json",
+    "yaml": "yaml",
+    "yml": "yaml",
+    "xml": "xml",
+    "md": "markdown",
+    "sql": "sql",
+}
+
 
 class HunkMappingWidget(Widget):
     """Widget displaying a single hunk to commit mapping."""
@@ -207,43 +242,8 @@ class DiffViewer(Widget):
         Returns:
             Language identifier for syntax highlighting
         """
-        extension = file_path.split(".")[-1].lower()
-
-        language_map = {
-            "py": "python",
-            "js": "javascript",
-            "ts": "typescript",
-            "jsx": "jsx",
-            "tsx": "tsx",
-            "java": "java",
-            "c": "c",
-            "cpp": "cpp",
-            "cc": "cpp",
-            "h": "c",
-            "hpp": "cpp",
-            "rs": "rust",
-            "go": "go",
-            "rb": "ruby",
-            "php": "php",
-            "sh": "bash",
-            "bash": "bash",
-            "zsh": "bash",
-            "fish": "bash",
-            "ps1": "powershell",
-            "html": "html",
-            "css": "css",
-            "scss": "scss",
-            "sass": "sass",
-            "less": "less",
-            "json": "json",
-            "yaml": "yaml",
-            "yml": "yaml",
-            "xml": "xml",
-            "md": "markdown",
-            "sql": "sql",
-        }
-
-        return language_map.get(extension, "text")
+        extension = file_path.rsplit(".", 1)[-1].lower()
+        return _LANGUAGE_BY_EXTENSION.get(extension, "text")
 
 
 class ProgressIndicator(Widget):
@@ -288,8 +288,11 @@ class ProgressIndicator(Widget):
     def _format_progress(self) -> str:
         """Format progress text."""
         total_processed = self.approved_count + self.ignored_count
+        # Integer percentage; exact halves round up
         percentage = (
-            (total_processed / self.total_hunks * 100) if self.total_hunks > 0 else 0
+            (100 * total_processed + self.total_hunks // 2) // self.total_hunks
+            if self.total_hunks > 0
+            else 0
         )
         status_parts = []
         if self.approved_count > 0:
@@ -302,4 +305,4 @@ class ProgressIndicator(Widget):
         else:
             status = ""
 
-        return f"Progress: {total_processed}/{self.total_hunks} selected {status} ({percentage:.0f}%)"
+        return f"Progress: {total_processed}/{self.total_hunks} selected {status} ({percentage}%)"
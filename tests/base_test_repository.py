@@ -6,6 +6,7 @@ that use GitOps for all git operations, implement resource management,
 and provide comprehensive error handling.
 """
 
+import os
 import tempfile
 import threading
 from pathlib import Path
@@ -48,6 +49,7 @@ class BaseTestRepository:
         self.git_ops = GitOps(repo_path)
         self._commit_hashes: List[str] = []
         self._temp_files: List[Path] = []
+        self._commit_env: Optional[Dict[str, str]] = None
 
         # Register for cleanup tracking
         BaseTestRepository._active_repositories.add(self)
@@ -165,19 +167,36 @@ class BaseTestRepository:
         if allow_empty:
             commit_args.append("--allow-empty")
 
-        result = self.git_ops.run_git_command(commit_args)
+        result = self.git_ops.run_git_command(commit_args, env=self._commit_env)
         if result.returncode != 0:
             raise GitOperationError(f"Failed to create commit: {result.stderr}")
 
-        # Get the commit hash
-        hash_result = self.git_ops.run_git_command(["rev-parse", "HEAD"])
-        if hash_result.returncode != 0:
-            raise GitOperationError(f"Failed to get commit hash: {hash_result.stderr}")
-
-        commit_hash = hash_result.stdout.strip()
+        commit_hash = self.rev_parse("HEAD")[0]
         self._commit_hashes.append(commit_hash)
         return commit_hash
 
+    def rev_parse(self, *refs: str) -> List[str]:
+        """
+        Resolve one or more refs to commit hashes in a single git call.
+
+        Args:
+            *refs: Refs to resolve, e.g. "HEAD~2", "HEAD~1", "HEAD"
+
+        Returns:
+            Commit hashes in the same order as refs
+
+        Raises:
+            GitOperationError: If any ref cannot be resolved
+        """
+        # --verify only accepts a single revision
+        args = (
+            ["rev-parse", "--verify", *refs] if len(refs) == 1 else ["rev-parse", *refs]
+        )
+        result = self.git_ops.run_git_command(args)
+        if result.returncode != 0:
+            raise GitOperationError(f"Failed to get commit hash: {result.stderr}")
+        return result.stdout.split()
+
     def add_commit(self, files_content: Dict[str, str], message: str) -> str:
         """
         Create files, stage them, and commit in one operation.
@@ -200,10 +219,10 @@ class BaseTestRepository:
         Returns:
             Current commit hash or None if no commits exist
         """
-        result = self.git_ops.run_git_command(["rev-parse", "HEAD"])
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
+        try:
+            return self.rev_parse("HEAD")[0]
+        except GitOperationError:
+            return None
 
     def get_commit_count(self) -> int:
         """
@@ -796,10 +815,33 @@ class StressTestRepository(ResourceManagedTestRepository):
     concurrent operations testing, and performance benchmarking.
     """
 
+    commit_name = "Stress Test"
+    commit_email = "stress@test.com"
+
     def __init__(self, repo_path: Path):
         """Initialize stress test repository."""
         super().__init__(repo_path)
         self._configure_git_for_performance()
+        self._commit_env = self._build_commit_env()
+
+    def _build_commit_env(self) -> Dict[str, str]:
+        """
+        Build the commit identity environment once for all stress commits.
+
+        Supplying author and committer through the environment means git
+        does not have to resolve user.name/user.email from config on every
+        one of the many commits a stress scenario creates.
+        """
+        env = dict(os.environ)
+        env.update(
+            {
+                "GIT_AUTHOR_NAME": self.commit_name,
+                "GIT_AUTHOR_EMAIL": self.commit_email,
+                "GIT_COMMITTER_NAME": self.commit_name,
+                "GIT_COMMITTER_EMAIL": self.commit_email,
+            }
+        )
+        return env
 
     def _configure_git_for_performance(self):
         """Configure git settings for performance testing."""
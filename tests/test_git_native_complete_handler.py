@@ -412,7 +412,8 @@ class TestCompleteHandlerIntegration:
             mock_handler.apply_ignored_hunks.return_value = True
             mock_handler_class.return_value = mock_handler
 
-            result = _apply_ignored_hunks([], git_ops)
+            mappings = [Mock()]
+            result = _apply_ignored_hunks(mappings, git_ops)
 
             assert result is True
             # Verify handler was created with git_ops and the global cache
@@ -420,7 +421,7 @@ class TestCompleteHandlerIntegration:
             call_args = mock_handler_class.call_args
             assert call_args[0][0] == git_ops  # First positional arg is git_ops
             assert "capability_cache" in call_args[1]  # Cache is passed as keyword arg
-            mock_handler.apply_ignored_hunks.assert_called_once_with([])
+            mock_handler.apply_ignored_hunks.assert_called_once_with(mappings)
 
     def test_environment_configuration_integration(self):
         """Test environment-based strategy configuration works end-to-end."""
@@ -1,9 +1,13 @@
 """Tests for git-native ignore handler."""
 
+import logging
 from unittest.mock import Mock, patch
 
 from git_autosquash.hunk_target_resolver import HunkTargetMapping
-from git_autosquash.git_native_handler import GitNativeIgnoreHandler
+from git_autosquash.git_native_handler import (
+    GitNativeIgnoreHandler,
+    create_combined_patch,
+)
 from git_autosquash.git_ops import GitOps
 from git_autosquash.hunk_parser import DiffHunk
 
@@ -384,10 +388,9 @@ class TestGitNativeIgnoreHandler:
             (True, "stash dropped"),  # stash drop
         ]
 
-        # Mock successful patch operations (stage 2 hunks + validate + apply)
+        # Mock successful patch operations (stage both hunks + validate + apply)
         self.git_ops._run_git_command_with_input.side_effect = [
-            (True, ""),  # apply --cached (file1)
-            (True, ""),  # apply --cached (file2)
+            (True, ""),  # apply --cached (file1 + file2)
             (True, ""),  # apply --check
             (True, ""),  # apply
         ]
@@ -396,8 +399,8 @@ class TestGitNativeIgnoreHandler:
 
         assert result is True
 
-        # Should stage both hunks + validate + apply (4 operations)
-        assert self.git_ops._run_git_command_with_input.call_count == 4
+        # Should stage both hunks at once + validate + apply (3 operations)
+        assert self.git_ops._run_git_command_with_input.call_count == 3
 
         # Verify final apply call contains patch from diff --cached
         # The patch content comes from diff --cached, not from input_text
@@ -405,6 +408,32 @@ class TestGitNativeIgnoreHandler:
         final_apply_call = calls[-1]  # Last call should be the final apply
         assert final_apply_call[0] == ("apply",)
 
+    def test_stage_failure_logs_file_paths(self, caplog):
+        """Test that a failed batch stage names the files it covered."""
+        hunks = [
+            DiffHunk(
+                file_path=file_path,
+                old_start=1,
+                old_count=1,
+                new_start=1,
+                new_count=1,
+                lines=["@@ -1,1 +1,1 @@", "-old", "+new"],
+                context_before=[],
+                context_after=[],
+            )
+            for file_path in ("file1.py", "file2.py", "file1.py")
+        ]
+        self.git_ops._run_git_command.return_value = (True, "100644 blob 0\tfile")
+        self.git_ops._run_git_command_with_input.return_value = (
+            False,
+            "patch does not apply",
+        )
+
+        with caplog.at_level(logging.WARNING):
+            assert self.handler._stage_hunks_to_index(hunks) is False
+
+        assert "file1.py, file2.py: patch does not apply" in caplog.text
+
     def test_index_state_capture_and_restore(self):
         """Test git index state capture and restore functionality."""
         handler = GitNativeIgnoreHandler(self.git_ops)
@@ -491,6 +520,71 @@ stash@{1}: On feature: def456 saved changes"""
         self.git_ops._run_git_command.assert_any_call("stash", "drop", "stash@{0}")
 
 
+def _patch_hunk(file_path: str, start: int) -> DiffHunk:
+    """Create a one-line addition hunk for patch building tests."""
+    return DiffHunk(
+        file_path=file_path,
+        old_start=start,
+        old_count=1,
+        new_start=start,
+        new_count=2,
+        lines=[f"@@ -{start},1 +{start},2 @@", " existing", "+added"],
+        context_before=[],
+        context_after=[],
+    )
+
+
+class TestCreateCombinedPatch:
+    """Test cases for create_combined_patch function."""
+
+    def test_empty_hunks(self):
+        """Test that no hunks produce an empty patch."""
+        assert create_combined_patch([]) == ""
+
+    def test_groups_hunks_under_one_header_per_file(self):
+        """Test hunks for the same file share a single diff header."""
+        hunks = [
+            _patch_hunk("a.py", 1),
+            _patch_hunk("b.py", 1),
+            _patch_hunk("a.py", 10),
+        ]
+
+        patch = create_combined_patch(hunks)
+
+        assert patch == (
+            "diff --git a/a.py b/a.py\n"
+            "--- a/a.py\n"
+            "+++ b/a.py\n"
+            "@@ -1,1 +1,2 @@\n"
+            " existing\n"
+            "+added\n"
+            "@@ -10,1 +10,2 @@\n"
+            " existing\n"
+            "+added\n"
+            "diff --git a/b.py b/b.py\n"
+            "--- a/b.py\n"
+            "+++ b/b.py\n"
+            "@@ -1,1 +1,2 @@\n"
+            " existing\n"
+            "+added\n"
+        )
+
+    def test_index_lines_looked_up_once_per_file(self):
+        """Test blob info adds one index line per file header."""
+        blob_info_for = Mock(
+            return_value={"old_hash": "aaa", "new_hash": "bbb", "mode": "100644"}
+        )
+
+        patch = create_combined_patch(
+            [_patch_hunk("a.py", 1), _patch_hunk("a.py", 10)], blob_info_for
+        )
+
+        blob_info_for.assert_called_once_with("a.py")
+        assert patch.startswith(
+            "diff --git a/a.py b/a.py\nindex aaa..bbb 100644\n--- a/a.py\n"
+        )
+
+
 class TestGitNativeHandlerIntegration:
     """Integration tests for git-native handler with main module."""
 
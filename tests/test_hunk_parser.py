@@ -99,6 +99,21 @@ class TestDiffHunk:
         assert hunk.has_additions is False
         assert hunk.has_deletions is False
 
+    def test_uses_slots(self) -> None:
+        """Test that DiffHunk instances carry no per-instance __dict__."""
+        hunk = DiffHunk(
+            file_path="test.py",
+            old_start=1,
+            old_count=1,
+            new_start=1,
+            new_count=1,
+            lines=[],
+            context_before=[],
+            context_after=[],
+        )
+
+        assert not hasattr(hunk, "__dict__")
+
 
 class TestHunkParser:
     """Test cases for HunkParser class."""
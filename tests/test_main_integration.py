@@ -224,7 +224,7 @@ class TestSimpleApprovalFallback:
         result = _simple_approval_fallback(mappings, blame_analyzer)
 
         assert len(result["approved"]) == 2
-        assert len(result["ignored"]) == 0  
+        assert len(result["ignored"]) == 0
         assert result["approved"][0] is mapping1
         assert result["approved"][1] is mapping3
 
@@ -265,12 +265,13 @@ class TestApplyIgnoredHunks:
     def test_empty_mappings(self) -> None:
         """Test applying empty ignored mappings list."""
         git_ops = Mock()
-        git_ops._run_git_command.return_value = (True, "")  # Mock worktree check
 
         result = _apply_ignored_hunks([], git_ops)
 
         assert result is True
-        # Note: Function now checks worktree support even for empty mappings
+        # Nothing to apply, so no handler setup or git commands should run
+        git_ops._run_git_command.assert_not_called()
+        git_ops._run_git_command_with_input.assert_not_called()
 
     def test_successful_apply(self) -> None:
         """Test successfully applying ignored hunks with batched implementation."""
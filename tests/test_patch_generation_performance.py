@@ -441,7 +441,7 @@ class TestPatchGenerationPerformance:
             )
 
 
-@pytest.mark.benchmark
+@pytest.mark.performance
 class TestPatchGenerationBenchmarks:
     """Benchmark tests for comparing performance across different scenarios."""
 
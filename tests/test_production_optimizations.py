@@ -9,6 +9,7 @@ from git_autosquash.git_ops import GitOps
 from git_autosquash.git_native_complete_handler import (
     GitNativeCompleteHandler,
     CapabilityCache,
+    _MISSING,
     _global_capability_cache,
     create_git_native_handler,
 )
@@ -33,12 +34,17 @@ class TestCapabilityCache:
         # Initially empty
         assert not cache.has("test_key")
         assert cache.get("test_key") is None
+        assert cache.get_or_missing("test_key") is _MISSING
 
         # Set and get
         cache.set("test_key", True)
         assert cache.has("test_key")
         assert cache.get("test_key") is True
 
+        # Cached falsy results are distinguishable from missing keys
+        cache.set("none_key", None)
+        assert cache.get_or_missing("none_key") is None
+
         # Overwrite
         cache.set("test_key", False)
         assert cache.get("test_key") is False
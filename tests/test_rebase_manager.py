@@ -1,8 +1,17 @@
-"""Tests for RebaseManager."""
+"""Tests for RebaseManager.
 
+All git, filesystem and temp-file access is mocked, and every test gets its
+own RebaseManager, so this module is safe to shard with pytest -n auto.
+"""
+
+import contextlib
+import io
+import os
 import subprocess
-import unittest.mock
-from unittest.mock import MagicMock, Mock, mock_open, patch
+import tempfile
+from types import SimpleNamespace
+from typing import Iterator, List
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -11,72 +20,141 @@ from git_autosquash.hunk_parser import DiffHunk
 from git_autosquash.rebase_manager import RebaseConflictError, RebaseManager
 
 
-class TestRebaseManager:
-    """Test cases for RebaseManager."""
-
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.mock_git_ops = Mock()
-        self.mock_git_ops.repo_path = "/test/repo"
-        self.merge_base = "abc123"
-        self.rebase_manager = RebaseManager(self.mock_git_ops, self.merge_base)
-
-    def test_init(self) -> None:
-        """Test RebaseManager initialization."""
-        assert self.rebase_manager.git_ops is self.mock_git_ops
-        assert self.rebase_manager.merge_base == self.merge_base
-        assert self.rebase_manager._stash_ref is None
-        assert self.rebase_manager._original_branch is None
-
-    def test_group_hunks_by_commit(self) -> None:
+MERGE_BASE = "abc123"
+
+# Shared read-only hunks; RebaseManager only reads hunk fields
+HUNK_FILE1_LINE1 = DiffHunk(
+    file_path="file1.py",
+    old_start=1,
+    old_count=1,
+    new_start=1,
+    new_count=2,
+    lines=["@@ -1,1 +1,2 @@", " line1", "+line2"],
+    context_before=[],
+    context_after=[],
+)
+HUNK_FILE1_LINE5 = DiffHunk(
+    file_path="file1.py",
+    old_start=5,
+    old_count=1,
+    new_start=5,
+    new_count=1,
+    lines=["@@ -5,1 +5,1 @@", "-old", "+new"],
+    context_before=[],
+    context_after=[],
+)
+HUNK_FILE1_LINE10 = DiffHunk(
+    file_path="file1.py",
+    old_start=10,
+    old_count=1,
+    new_start=10,
+    new_count=1,
+    lines=["@@ -10,1 +10,1 @@", "-old2", "+new2"],
+    context_before=[],
+    context_after=[],
+)
+HUNK_FILE2_LINE5 = DiffHunk(
+    file_path="file2.py",
+    old_start=5,
+    old_count=1,
+    new_start=5,
+    new_count=1,
+    lines=["@@ -5,1 +5,1 @@", "-old", "+new"],
+    context_before=[],
+    context_after=[],
+)
+
+
+# Patch expected from HUNK_FILE1_LINE1 followed by HUNK_FILE2_LINE5
+EXPECTED_TWO_FILE_PATCH = (
+    "--- a/file1.py\n"
+    "+++ b/file1.py\n"
+    "@@ -1,1 +1,2 @@\n"
+    " line1\n"
+    "+line2\n"
+    "--- a/file2.py\n"
+    "+++ b/file2.py\n"
+    "@@ -5,1 +5,1 @@\n"
+    "-old\n"
+    "+new\n"
+)
+
+
+@pytest.fixture
+def mock_git_ops() -> Mock:
+    """Mocked GitOps for the repository under test."""
+    mock_git_ops = Mock()
+    mock_git_ops.repo_path = "/test/repo"
+    return mock_git_ops
+
+
+@pytest.fixture
+def rebase_manager(mock_git_ops: Mock) -> RebaseManager:
+    """Create a fresh RebaseManager backed by the mocked GitOps."""
+    return RebaseManager(mock_git_ops, MERGE_BASE)
+
+
+def _git_result(
+    returncode: int = 0, stdout: str = "", stderr: str = ""
+) -> SimpleNamespace:
+    """Build a lightweight stand-in for a completed git subprocess."""
+    return SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+def _stub_branch_commits(
+    monkeypatch: pytest.MonkeyPatch, branch_commits: List[str]
+) -> None:
+    """Make BatchGitOperations report a fixed list of branch commits."""
+    batch_ops = SimpleNamespace(get_branch_commits=lambda: branch_commits)
+    monkeypatch.setattr(
+        "git_autosquash.rebase_manager.BatchGitOperations",
+        lambda git_ops, merge_base: batch_ops,
+    )
+
+
+@pytest.fixture
+def fake_tempfile(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Route NamedTemporaryFile and os.unlink through an in-memory fake.
+
+    Tests set ``name`` before use and assert on ``writes`` and ``unlinked``.
+    """
+    state = SimpleNamespace(name="/tmp/test_tempfile", writes=[], unlinked=[])
+
+    @contextlib.contextmanager
+    def _fake_tmp(*args: object, **kwargs: object) -> Iterator[SimpleNamespace]:
+        yield SimpleNamespace(name=state.name, write=state.writes.append)
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", _fake_tmp)
+    monkeypatch.setattr(os, "unlink", state.unlinked.append)
+    return state
+
+
+class TestGrouping:
+    """Test grouping and ordering of hunks by target commit."""
+
+    def test_group_hunks_by_commit(self, rebase_manager: RebaseManager) -> None:
         """Test grouping hunks by target commit."""
-        hunk1 = DiffHunk(
-            file_path="file1.py",
-            old_start=1,
-            old_count=1,
-            new_start=1,
-            new_count=2,
-            lines=["@@ -1,1 +1,2 @@", " line1", "+line2"],
-            context_before=[],
-            context_after=[],
-        )
-        hunk2 = DiffHunk(
-            file_path="file2.py",
-            old_start=5,
-            old_count=1,
-            new_start=5,
-            new_count=1,
-            lines=["@@ -5,1 +5,1 @@", "-old", "+new"],
-            context_before=[],
-            context_after=[],
-        )
-        hunk3 = DiffHunk(
-            file_path="file1.py",
-            old_start=10,
-            old_count=1,
-            new_start=10,
-            new_count=1,
-            lines=["@@ -10,1 +10,1 @@", "-old2", "+new2"],
-            context_before=[],
-            context_after=[],
-        )
-
+        hunk1, hunk2, hunk3 = HUNK_FILE1_LINE1, HUNK_FILE2_LINE5, HUNK_FILE1_LINE10
+
+        # Grouping only reads mappings, so they can share one empty blame list
+        no_blame: list = []
+        targets = [
+            (hunk1, "commit1", "high"),
+            (hunk2, "commit2", "high"),
+            (hunk3, "commit1", "medium"),
+            (hunk1, None, "low"),
+        ]
         mappings = [
             HunkTargetMapping(
-                hunk=hunk1, target_commit="commit1", confidence="high", blame_info=[]
-            ),
-            HunkTargetMapping(
-                hunk=hunk2, target_commit="commit2", confidence="high", blame_info=[]
-            ),
-            HunkTargetMapping(
-                hunk=hunk3, target_commit="commit1", confidence="medium", blame_info=[]
-            ),
-            HunkTargetMapping(
-                hunk=hunk1, target_commit=None, confidence="low", blame_info=[]
-            ),
+                hunk=hunk,
+                target_commit=commit,
+                confidence=confidence,
+                blame_info=no_blame,
+            )
+            for hunk, commit, confidence in targets
         ]
 
-        result = self.rebase_manager._group_hunks_by_commit(mappings)
+        result = rebase_manager._group_hunks_by_commit(mappings)
 
         assert len(result) == 2
         assert "commit1" in result
@@ -86,230 +164,139 @@ class TestRebaseManager:
         assert result["commit1"] == [hunk1, hunk3]
         assert result["commit2"] == [hunk2]
 
-    def test_get_commit_order(self) -> None:
+    def test_get_commit_order(
+        self, monkeypatch: pytest.MonkeyPatch, rebase_manager: RebaseManager
+    ) -> None:
         """Test getting commits in git topological order."""
         commits = {"commit1", "commit2", "commit3"}
 
-        # Mock BatchGitOperations to return branch commits in topological order (newest first)
-        with patch(
-            "git_autosquash.rebase_manager.BatchGitOperations"
-        ) as mock_batch_ops_class:
-            mock_batch_ops = Mock()
-            mock_batch_ops_class.return_value = mock_batch_ops
-
-            # Simulate git topological order: commit2 -> commit3 -> commit1 (newest to oldest)
-            mock_batch_ops.get_branch_commits.return_value = [
-                "commit2",
-                "commit3",
-                "commit1",
-            ]
+        # Simulate git topological order: commit2 -> commit3 -> commit1 (newest to oldest)
+        _stub_branch_commits(monkeypatch, ["commit2", "commit3", "commit1"])
 
-            result = self.rebase_manager._get_commit_order(commits)
+        result = rebase_manager._get_commit_order(commits)
 
-            # Should be ordered by git topology (oldest first)
-            assert result == ["commit1", "commit3", "commit2"]
+        # Should be ordered by git topology (oldest first)
+        assert result == ["commit1", "commit3", "commit2"]
 
-    def test_get_commit_order_with_missing_commits(self) -> None:
+    def test_get_commit_order_with_missing_commits(
+        self, monkeypatch: pytest.MonkeyPatch, rebase_manager: RebaseManager
+    ) -> None:
         """Test commit ordering when some commits are not found in branch."""
         commits = {"commit1", "commit2", "commit3"}
 
-        # Mock BatchGitOperations to return only some commits
-        with patch(
-            "git_autosquash.rebase_manager.BatchGitOperations"
-        ) as mock_batch_ops_class:
-            mock_batch_ops = Mock()
-            mock_batch_ops_class.return_value = mock_batch_ops
+        # Only commit1 and commit2 are in branch, commit3 is missing
+        _stub_branch_commits(monkeypatch, ["commit2", "commit1"])
+
+        result = rebase_manager._get_commit_order(commits)
 
-            # Only commit1 and commit2 are in branch, commit3 is missing
-            mock_batch_ops.get_branch_commits.return_value = ["commit2", "commit1"]
+        # commit1 and commit2 should be in topological order, commit3 at end (fallback)
+        assert result[0] == "commit1"  # oldest first
+        assert result[1] == "commit2"
+        assert result[2] == "commit3"  # missing commits added at end
 
-            result = self.rebase_manager._get_commit_order(commits)
 
-            # commit1 and commit2 should be in topological order, commit3 at end (fallback)
-            assert result[0] == "commit1"  # oldest first
-            assert result[1] == "commit2"
-            assert result[2] == "commit3"  # missing commits added at end
+class TestWorkingTreeState:
+    """Test stashing of working tree changes before a rebase."""
 
-    def test_handle_working_tree_state_clean(self) -> None:
+    def test_handle_working_tree_state_clean(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test handling clean working tree."""
-        self.mock_git_ops.get_working_tree_status.return_value = {
+        mock_git_ops.get_working_tree_status.return_value = {
             "is_clean": True,
             "has_staged": False,
             "has_unstaged": False,
         }
 
-        self.rebase_manager._handle_working_tree_state()
+        rebase_manager._handle_working_tree_state()
 
         # Should not call stash
-        self.mock_git_ops.run_git_command.assert_not_called()
-        assert self.rebase_manager._stash_ref is None
+        mock_git_ops.run_git_command.assert_not_called()
+        assert rebase_manager._stash_ref is None
 
-    def test_handle_working_tree_state_dirty(self) -> None:
+    def test_handle_working_tree_state_dirty(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test handling dirty working tree."""
-        self.mock_git_ops.get_working_tree_status.return_value = {
+        mock_git_ops.get_working_tree_status.return_value = {
             "is_clean": False,
             "has_staged": True,
             "has_unstaged": False,
         }
 
         # Mock successful stash
-        stash_result = Mock()
-        stash_result.returncode = 0
-        self.mock_git_ops.run_git_command.return_value = stash_result
+        stash_result = _git_result(0)
+        mock_git_ops.run_git_command.return_value = stash_result
 
-        self.rebase_manager._handle_working_tree_state()
+        rebase_manager._handle_working_tree_state()
 
         # Should call stash
-        self.mock_git_ops.run_git_command.assert_called_once_with(
+        mock_git_ops.run_git_command.assert_called_once_with(
             ["stash", "push", "-m", "git-autosquash temp stash"]
         )
-        assert self.rebase_manager._stash_ref == "stash@{0}"
+        assert rebase_manager._stash_ref == "stash@{0}"
 
-    def test_handle_working_tree_state_stash_fails(self) -> None:
+    def test_handle_working_tree_state_stash_fails(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test handling when stash fails."""
-        self.mock_git_ops.get_working_tree_status.return_value = {
+        mock_git_ops.get_working_tree_status.return_value = {
             "is_clean": False,
             "has_staged": True,
             "has_unstaged": False,
         }
 
         # Mock failed stash
-        stash_result = Mock()
-        stash_result.returncode = 1
-        stash_result.stderr = "stash failed"
-        self.mock_git_ops.run_git_command.return_value = stash_result
+        stash_result = _git_result(1, stderr="stash failed")
+        mock_git_ops.run_git_command.return_value = stash_result
 
         with pytest.raises(Exception, match="Failed to stash changes"):
-            self.rebase_manager._handle_working_tree_state()
+            rebase_manager._handle_working_tree_state()
 
-    def test_create_patch_for_hunks(self) -> None:
+
+class TestPatchApplication:
+    """Test patch creation and application."""
+
+    def test_create_patch_for_hunks(self, rebase_manager: RebaseManager) -> None:
         """Test creating patch content from hunks."""
-        hunk1 = DiffHunk(
-            file_path="file1.py",
-            old_start=1,
-            old_count=1,
-            new_start=1,
-            new_count=2,
-            lines=["@@ -1,1 +1,2 @@", " line1", "+line2"],
-            context_before=[],
-            context_after=[],
-        )
-        hunk2 = DiffHunk(
-            file_path="file2.py",
-            old_start=5,
-            old_count=1,
-            new_start=5,
-            new_count=1,
-            lines=["@@ -5,1 +5,1 @@", "-old", "+new"],
-            context_before=[],
-            context_after=[],
+        result = rebase_manager._create_patch_for_hunks(
+            [HUNK_FILE1_LINE1, HUNK_FILE2_LINE5]
         )
 
-        result = self.rebase_manager._create_patch_for_hunks([hunk1, hunk2])
-
-        expected_lines = [
-            "--- a/file1.py",
-            "+++ b/file1.py",
-            "@@ -1,1 +1,2 @@",
-            " line1",
-            "+line2",
-            "--- a/file2.py",
-            "+++ b/file2.py",
-            "@@ -5,1 +5,1 @@",
-            "-old",
-            "+new",
-        ]
-        expected = "\n".join(expected_lines) + "\n"
-        assert result == expected
+        assert result == EXPECTED_TWO_FILE_PATCH
 
-    def test_create_patch_for_hunks_same_file(self) -> None:
+    def test_create_patch_for_hunks_same_file(
+        self, rebase_manager: RebaseManager
+    ) -> None:
         """Test creating patch when multiple hunks are from same file."""
-        hunk1 = DiffHunk(
-            file_path="file1.py",
-            old_start=1,
-            old_count=1,
-            new_start=1,
-            new_count=2,
-            lines=["@@ -1,1 +1,2 @@", " line1", "+line2"],
-            context_before=[],
-            context_after=[],
-        )
-        hunk2 = DiffHunk(
-            file_path="file1.py",
-            old_start=5,
-            old_count=1,
-            new_start=5,
-            new_count=1,
-            lines=["@@ -5,1 +5,1 @@", "-old", "+new"],
-            context_before=[],
-            context_after=[],
+        result = rebase_manager._create_patch_for_hunks(
+            [HUNK_FILE1_LINE1, HUNK_FILE1_LINE5]
         )
 
-        result = self.rebase_manager._create_patch_for_hunks([hunk1, hunk2])
-
         # Should only have one file header for file1.py
         lines = result.split("\n")
         file_headers = [line for line in lines if line.startswith("---")]
         assert len(file_headers) == 1
         assert file_headers[0] == "--- a/file1.py"
 
-    @patch("tempfile.NamedTemporaryFile")
-    @patch("os.unlink")
-    def test_start_rebase_edit_success(self, mock_unlink, mock_tempfile) -> None:
-        """Test starting rebase edit successfully."""
-        # Mock temp file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test_todo"
-        mock_tempfile.return_value.__enter__.return_value = mock_file
-
-        # Mock successful rebase start
-        rebase_result = Mock()
-        rebase_result.returncode = 0
-        self.mock_git_ops.run_git_command.return_value = rebase_result
-
-        result = self.rebase_manager._start_rebase_edit("commit123")
-
-        assert result is True
-        mock_file.write.assert_called_once_with("edit commit123\n")
-        self.mock_git_ops.run_git_command.assert_called_once()
-        mock_unlink.assert_called_once_with("/tmp/test_todo")
-
-    @patch("tempfile.NamedTemporaryFile")
-    def test_start_rebase_edit_failure(self, mock_tempfile) -> None:
-        """Test rebase edit start failure."""
-        # Mock temp file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test_todo"
-        mock_tempfile.return_value.__enter__.return_value = mock_file
-
-        # Mock failed rebase start
-        rebase_result = Mock()
-        rebase_result.returncode = 1
-        self.mock_git_ops.run_git_command.return_value = rebase_result
-
-        result = self.rebase_manager._start_rebase_edit("commit123")
-
-        assert result is False
-
-    @patch("tempfile.NamedTemporaryFile")
-    @patch("os.unlink")
-    def test_apply_patch_success(self, mock_unlink, mock_tempfile) -> None:
+    def test_apply_patch_success(
+        self,
+        fake_tempfile: SimpleNamespace,
+        rebase_manager: RebaseManager,
+        mock_git_ops: Mock,
+    ) -> None:
         """Test successful patch application."""
-        # Mock temp file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test_patch"
-        mock_tempfile.return_value.__enter__.return_value = mock_file
+        fake_tempfile.name = "/tmp/test_patch"
 
         # Mock successful git apply
-        apply_result = Mock()
-        apply_result.returncode = 0
-        self.mock_git_ops.run_git_command.return_value = apply_result
+        apply_result = _git_result(0)
+        mock_git_ops.run_git_command.return_value = apply_result
 
         patch_content = "patch content"
-        self.rebase_manager._apply_patch(patch_content)
+        rebase_manager._apply_patch(patch_content)
 
-        mock_file.write.assert_called_once_with(patch_content)
-        self.mock_git_ops.run_git_command.assert_called_once_with(
+        assert fake_tempfile.writes == [patch_content]
+        mock_git_ops.run_git_command.assert_called_once_with(
             [
                 "apply",
                 "--3way",
@@ -318,242 +305,311 @@ class TestRebaseManager:
                 "/tmp/test_patch",
             ]
         )
-        mock_unlink.assert_called_once_with("/tmp/test_patch")
-
-    @patch("tempfile.NamedTemporaryFile")
-    def test_apply_patch_with_conflicts(self, mock_tempfile) -> None:
+        assert fake_tempfile.unlinked == ["/tmp/test_patch"]
+
+    def test_apply_patch_with_conflicts(
+        self,
+        fake_tempfile: SimpleNamespace,
+        rebase_manager: RebaseManager,
+        mock_git_ops: Mock,
+    ) -> None:
         """Test patch application with conflicts."""
-        # Mock temp file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test_patch"
-        mock_tempfile.return_value.__enter__.return_value = mock_file
+        fake_tempfile.name = "/tmp/test_patch"
 
         # Mock failed git apply
-        apply_result = Mock()
-        apply_result.returncode = 1
-        apply_result.stderr = "conflict error"
-        self.mock_git_ops.run_git_command.return_value = apply_result
+        apply_result = _git_result(1, stderr="conflict error")
+        mock_git_ops.run_git_command.return_value = apply_result
 
         # Mock _get_conflicted_files to return conflicts
         with patch.object(
-            self.rebase_manager, "_get_conflicted_files", return_value=["file1.py"]
+            rebase_manager, "_get_conflicted_files", return_value=["file1.py"]
         ):
             with pytest.raises(RebaseConflictError) as exc_info:
-                self.rebase_manager._apply_patch("patch content")
+                rebase_manager._apply_patch("patch content")
 
             assert "conflict error" in str(exc_info.value)
             assert exc_info.value.conflicted_files == ["file1.py"]
 
-    def test_amend_commit_success(self) -> None:
+
+class TestRebaseLifecycle:
+    """Test starting, continuing, aborting and cleaning up rebases."""
+
+    def test_init(self, rebase_manager: RebaseManager, mock_git_ops: Mock) -> None:
+        """Test RebaseManager initialization."""
+        assert rebase_manager.git_ops is mock_git_ops
+        assert rebase_manager.merge_base == MERGE_BASE
+        assert rebase_manager._stash_ref is None
+        assert rebase_manager._original_branch is None
+
+    def test_start_rebase_edit_success(
+        self,
+        fake_tempfile: SimpleNamespace,
+        rebase_manager: RebaseManager,
+        mock_git_ops: Mock,
+    ) -> None:
+        """Test starting rebase edit successfully."""
+        fake_tempfile.name = "/tmp/test_todo"
+
+        # Mock successful rebase start
+        rebase_result = _git_result(0)
+        mock_git_ops.run_git_command.return_value = rebase_result
+
+        result = rebase_manager._start_rebase_edit("commit123")
+
+        assert result is True
+        assert fake_tempfile.writes == ["edit commit123\n"]
+        mock_git_ops.run_git_command.assert_called_once()
+        assert fake_tempfile.unlinked == ["/tmp/test_todo"]
+
+    def test_start_rebase_edit_failure(
+        self,
+        fake_tempfile: SimpleNamespace,
+        rebase_manager: RebaseManager,
+        mock_git_ops: Mock,
+    ) -> None:
+        """Test rebase edit start failure."""
+        fake_tempfile.name = "/tmp/test_todo"
+
+        # Mock failed rebase start
+        rebase_result = _git_result(1)
+        mock_git_ops.run_git_command.return_value = rebase_result
+
+        result = rebase_manager._start_rebase_edit("commit123")
+
+        assert result is False
+
+    def test_amend_commit_success(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test successful commit amendment."""
         # Mock successful git commands
-        success_result = Mock()
-        success_result.returncode = 0
-        self.mock_git_ops.run_git_command.return_value = success_result
+        success_result = _git_result(0)
+        mock_git_ops.run_git_command.return_value = success_result
 
-        self.rebase_manager._amend_commit()
+        rebase_manager._amend_commit()
 
         # Should call git add and git commit
-        expected_calls = [
-            unittest.mock.call(["add", "."]),
-            unittest.mock.call(["commit", "--amend", "--no-edit"]),
+        assert [c.args for c in mock_git_ops.run_git_command.call_args_list] == [
+            (["add", "."],),
+            (["commit", "--amend", "--no-edit"],),
         ]
-        self.mock_git_ops.run_git_command.assert_has_calls(expected_calls)
 
-    def test_amend_commit_add_fails(self) -> None:
+    def test_amend_commit_add_fails(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test commit amendment when git add fails."""
         # Mock failed git add
-        add_result = Mock()
-        add_result.returncode = 1
-        add_result.stderr = "add failed"
-        self.mock_git_ops.run_git_command.return_value = add_result
+        add_result = _git_result(1, stderr="add failed")
+        mock_git_ops.run_git_command.return_value = add_result
 
         with pytest.raises(Exception, match="Failed to stage changes"):
-            self.rebase_manager._amend_commit()
+            rebase_manager._amend_commit()
 
-    def test_continue_rebase_success(self) -> None:
+    def test_continue_rebase_success(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test successful rebase continuation."""
-        continue_result = Mock()
-        continue_result.returncode = 0
-        self.mock_git_ops.run_git_command.return_value = continue_result
+        continue_result = _git_result(0)
+        mock_git_ops.run_git_command.return_value = continue_result
 
-        self.rebase_manager._continue_rebase()
+        rebase_manager._continue_rebase()
 
-        self.mock_git_ops.run_git_command.assert_called_once_with(
-            ["rebase", "--continue"]
-        )
+        mock_git_ops.run_git_command.assert_called_once_with(["rebase", "--continue"])
 
-    def test_continue_rebase_with_conflicts(self) -> None:
+    def test_continue_rebase_with_conflicts(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test rebase continuation with conflicts."""
         # Mock failed rebase continue
-        continue_result = Mock()
-        continue_result.returncode = 1
-        continue_result.stderr = "conflicts detected"
-        self.mock_git_ops.run_git_command.return_value = continue_result
+        continue_result = _git_result(1, stderr="conflicts detected")
+        mock_git_ops.run_git_command.return_value = continue_result
 
         # Mock conflicted files
         with patch.object(
-            self.rebase_manager, "_get_conflicted_files", return_value=["file1.py"]
+            rebase_manager, "_get_conflicted_files", return_value=["file1.py"]
         ):
             with pytest.raises(RebaseConflictError) as exc_info:
-                self.rebase_manager._continue_rebase()
+                rebase_manager._continue_rebase()
 
             assert "conflicts detected" in str(exc_info.value)
             assert exc_info.value.conflicted_files == ["file1.py"]
 
-    def test_get_conflicted_files(self) -> None:
-        """Test getting conflicted files."""
-        # Mock git diff output with conflicted files
-        diff_result = Mock()
-        diff_result.returncode = 0
-        diff_result.stdout = "file1.py\nfile2.py\n"
-        self.mock_git_ops.run_git_command.return_value = diff_result
-
-        result = self.rebase_manager._get_conflicted_files()
-
-        assert result == ["file1.py", "file2.py"]
-        self.mock_git_ops.run_git_command.assert_called_once_with(
-            ["diff", "--name-only", "--diff-filter=U"]
-        )
-
-    def test_get_conflicted_files_no_conflicts(self) -> None:
-        """Test getting conflicted files when none exist."""
-        # Mock git diff with no output
-        diff_result = Mock()
-        diff_result.returncode = 0
-        diff_result.stdout = ""
-        self.mock_git_ops.run_git_command.return_value = diff_result
-
-        result = self.rebase_manager._get_conflicted_files()
-
-        assert result == []
-
-    def test_get_conflicted_files_command_fails(self) -> None:
-        """Test getting conflicted files when git command fails."""
-        # Mock git diff failure
-        diff_result = Mock()
-        diff_result.returncode = 1
-        self.mock_git_ops.run_git_command.return_value = diff_result
-
-        result = self.rebase_manager._get_conflicted_files()
-
-        assert result == []
-
-    def test_abort_rebase(self) -> None:
+    def test_abort_rebase(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test aborting rebase."""
-        abort_result = Mock()
-        abort_result.returncode = 0
-        self.mock_git_ops.run_git_command.return_value = abort_result
+        abort_result = _git_result(0)
+        mock_git_ops.run_git_command.return_value = abort_result
 
-        self.rebase_manager._abort_rebase()
+        rebase_manager._abort_rebase()
 
-        self.mock_git_ops.run_git_command.assert_called_once_with(["rebase", "--abort"])
+        mock_git_ops.run_git_command.assert_called_once_with(["rebase", "--abort"])
 
-    def test_abort_rebase_ignores_errors(self) -> None:
+    def test_abort_rebase_ignores_errors(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test that abort rebase ignores errors."""
         # Mock git command to raise subprocess error
-        self.mock_git_ops.run_git_command.side_effect = subprocess.SubprocessError(
+        mock_git_ops.run_git_command.side_effect = subprocess.SubprocessError(
             "abort failed"
         )
 
         # Should not raise exception
-        self.rebase_manager._abort_rebase()
+        rebase_manager._abort_rebase()
 
-    def test_cleanup_on_error(self) -> None:
+    def test_cleanup_on_error(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test cleanup after error."""
-        self.rebase_manager._stash_ref = "stash@{0}"
+        rebase_manager._stash_ref = "stash@{0}"
 
         # Mock successful commands
-        success_result = Mock()
-        success_result.returncode = 0
-        self.mock_git_ops.run_git_command.return_value = success_result
+        success_result = _git_result(0)
+        mock_git_ops.run_git_command.return_value = success_result
 
-        self.rebase_manager._cleanup_on_error()
+        rebase_manager._cleanup_on_error()
 
         # Should call abort rebase and stash pop
-        expected_calls = [
-            unittest.mock.call(["rebase", "--abort"]),
-            unittest.mock.call(["stash", "pop", "stash@{0}"]),
+        assert [c.args for c in mock_git_ops.run_git_command.call_args_list] == [
+            (["rebase", "--abort"],),
+            (["stash", "pop", "stash@{0}"],),
         ]
-        self.mock_git_ops.run_git_command.assert_has_calls(expected_calls)
-        assert self.rebase_manager._stash_ref is None
+        assert rebase_manager._stash_ref is None
 
-    def test_cleanup_on_error_no_stash(self) -> None:
+    def test_cleanup_on_error_no_stash(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
         """Test cleanup when no stash exists."""
         # No stash ref set
-        assert self.rebase_manager._stash_ref is None
+        assert rebase_manager._stash_ref is None
 
-        success_result = Mock()
-        success_result.returncode = 0
-        self.mock_git_ops.run_git_command.return_value = success_result
+        success_result = _git_result(0)
+        mock_git_ops.run_git_command.return_value = success_result
 
-        self.rebase_manager._cleanup_on_error()
+        rebase_manager._cleanup_on_error()
 
         # Should only call abort rebase, not stash pop
-        self.mock_git_ops.run_git_command.assert_called_once_with(["rebase", "--abort"])
-
-    def test_is_rebase_in_progress_true(self) -> None:
-        """Test detecting rebase in progress."""
-        status_result = Mock()
-        status_result.returncode = 0
-        status_result.stdout = (
-            "# rebase in progress; onto abc123\n# branch.head = main\n"
-        )
-        self.mock_git_ops.run_git_command.return_value = status_result
-
-        result = self.rebase_manager.is_rebase_in_progress()
+        mock_git_ops.run_git_command.assert_called_once_with(["rebase", "--abort"])
 
+    def test_execute_squash_empty_mappings(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
+        """Test executing squash with no mappings."""
+        result = rebase_manager.execute_squash([])
         assert result is True
+        mock_git_ops.get_current_branch.assert_not_called()
 
-    def test_is_rebase_in_progress_false(self) -> None:
-        """Test detecting no rebase in progress."""
-        status_result = Mock()
-        status_result.returncode = 0
-        status_result.stdout = "# branch.head = main\n"
-        self.mock_git_ops.run_git_command.return_value = status_result
+    def test_execute_squash_no_current_branch(
+        self, rebase_manager: RebaseManager, mock_git_ops: Mock
+    ) -> None:
+        """Test executing squash when current branch cannot be determined."""
+        mapping = HunkTargetMapping(
+            hunk=HUNK_FILE1_LINE1,
+            target_commit="abc123",
+            confidence="high",
+            blame_info=[],
+        )
 
-        result = self.rebase_manager.is_rebase_in_progress()
+        mock_git_ops.get_current_branch.return_value = None
 
-        assert result is False
+        with pytest.raises(ValueError, match="Cannot determine current branch"):
+            rebase_manager.execute_squash([mapping])
 
-    def test_is_rebase_in_progress_command_fails(self) -> None:
-        """Test rebase detection when git command fails."""
-        status_result = Mock()
-        status_result.returncode = 1
-        self.mock_git_ops.run_git_command.return_value = status_result
 
-        result = self.rebase_manager.is_rebase_in_progress()
+class TestStatus:
+    """Test rebase and conflict status reporting."""
 
-        assert result is False
+    @pytest.mark.parametrize(
+        "returncode,stdout,expected",
+        [
+            pytest.param(
+                0, "file1.py\nfile2.py\n", ["file1.py", "file2.py"], id="conflicts"
+            ),
+            pytest.param(0, "", [], id="no_conflicts"),
+            pytest.param(1, "", [], id="command_fails"),
+        ],
+    )
+    def test_get_conflicted_files(
+        self,
+        returncode: int,
+        stdout: str,
+        expected: list,
+        rebase_manager: RebaseManager,
+        mock_git_ops: Mock,
+    ) -> None:
+        """Test getting conflicted files from git diff output."""
+        diff_result = _git_result(returncode, stdout=stdout)
+        mock_git_ops.run_git_command.return_value = diff_result
+
+        result = rebase_manager._get_conflicted_files()
+
+        assert result == expected
+        mock_git_ops.run_git_command.assert_called_once_with(
+            ["diff", "--name-only", "--diff-filter=U"]
+        )
 
-    @patch("os.path.exists")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_get_rebase_status_in_progress(self, mock_file, mock_exists) -> None:
+    @pytest.mark.parametrize(
+        "returncode,stdout,expected",
+        [
+            pytest.param(
+                0,
+                "# rebase in progress; onto abc123\n# branch.head = main\n",
+                True,
+                id="in_progress",
+            ),
+            pytest.param(0, "# branch.head = main\n", False, id="not_in_progress"),
+            pytest.param(1, "", False, id="command_fails"),
+        ],
+    )
+    def test_is_rebase_in_progress(
+        self,
+        returncode: int,
+        stdout: str,
+        expected: bool,
+        rebase_manager: RebaseManager,
+        mock_git_ops: Mock,
+    ) -> None:
+        """Test detecting whether a rebase is in progress."""
+        status_result = _git_result(returncode, stdout=stdout)
+        mock_git_ops.run_git_command.return_value = status_result
+
+        result = rebase_manager.is_rebase_in_progress()
+
+        assert result is expected
+
+    def test_get_rebase_status_in_progress(
+        self, monkeypatch: pytest.MonkeyPatch, rebase_manager: RebaseManager
+    ) -> None:
         """Test getting rebase status when rebase is in progress."""
-        # Mock rebase directory and files exist
-        mock_exists.return_value = True
-        mock_file.return_value.read.side_effect = ["3", "10"]  # step 3 of 10
+        # Serve the rebase step files from memory: step 3 of 10
+        rebase_dir = os.path.join("/test/repo", ".git", "rebase-merge")
+        step_files = {
+            os.path.join(rebase_dir, "msgnum"): "3",
+            os.path.join(rebase_dir, "end"): "10",
+        }
+        monkeypatch.setattr(os.path, "exists", lambda path: True)
+        monkeypatch.setattr(
+            "builtins.open", lambda path, *args, **kwargs: io.StringIO(step_files[path])
+        )
 
         # Mock rebase in progress
-        with patch.object(
-            self.rebase_manager, "is_rebase_in_progress", return_value=True
-        ):
+        with patch.object(rebase_manager, "is_rebase_in_progress", return_value=True):
             with patch.object(
-                self.rebase_manager, "_get_conflicted_files", return_value=["file1.py"]
+                rebase_manager, "_get_conflicted_files", return_value=["file1.py"]
             ):
-                result = self.rebase_manager.get_rebase_status()
+                result = rebase_manager.get_rebase_status()
 
                 assert result["in_progress"] is True
                 assert result["conflicted_files"] == ["file1.py"]
                 assert result["step"] == 3
                 assert result["total_steps"] == 10
 
-    def test_get_rebase_status_not_in_progress(self) -> None:
+    def test_get_rebase_status_not_in_progress(
+        self, rebase_manager: RebaseManager
+    ) -> None:
         """Test getting rebase status when no rebase is active."""
-        with patch.object(
-            self.rebase_manager, "is_rebase_in_progress", return_value=False
-        ):
-            result = self.rebase_manager.get_rebase_status()
+        with patch.object(rebase_manager, "is_rebase_in_progress", return_value=False):
+            result = rebase_manager.get_rebase_status()
 
             assert result["in_progress"] is False
             assert result["current_commit"] is None
@@ -561,33 +617,6 @@ class TestRebaseManager:
             assert result["step"] is None
             assert result["total_steps"] is None
 
-    def test_execute_squash_empty_mappings(self) -> None:
-        """Test executing squash with no mappings."""
-        result = self.rebase_manager.execute_squash([])
-        assert result is True
-        self.mock_git_ops.get_current_branch.assert_not_called()
-
-    def test_execute_squash_no_current_branch(self) -> None:
-        """Test executing squash when current branch cannot be determined."""
-        hunk = DiffHunk(
-            file_path="file1.py",
-            old_start=1,
-            old_count=1,
-            new_start=1,
-            new_count=2,
-            lines=["@@ -1,1 +1,2 @@", " line1", "+line2"],
-            context_before=[],
-            context_after=[],
-        )
-        mapping = HunkTargetMapping(
-            hunk=hunk, target_commit="abc123", confidence="high", blame_info=[]
-        )
-
-        self.mock_git_ops.get_current_branch.return_value = None
-
-        with pytest.raises(ValueError, match="Cannot determine current branch"):
-            self.rebase_manager.execute_squash([mapping])
-
 
 class TestRebaseConflictError:
     """Test cases for RebaseConflictError."""
@@ -188,6 +188,22 @@ class TestUIStateController:
         stats = self.controller.get_progress_stats()
         assert stats == {"approved": 1, "ignored": 1, "selected": 2, "total": 3}
 
+    def test_progress_stats_repeated_updates(self) -> None:
+        """Test that repeated or no-op updates do not skew the counts."""
+        self.controller.set_approved(self.mapping1, True)
+        self.controller.set_approved(self.mapping1, True)
+        self.controller.set_ignored(self.mapping2, False)
+
+        stats = self.controller.get_progress_stats()
+        assert stats == {"approved": 1, "ignored": 0, "selected": 1, "total": 3}
+
+        self.controller.set_approved(self.mapping1, False)
+        self.controller.set_approved(self.mapping1, False)
+
+        stats = self.controller.get_progress_stats()
+        assert stats == {"approved": 0, "ignored": 0, "selected": 0, "total": 3}
+        assert not self.controller.has_selections()
+
     def test_mapping_index_lookup(self) -> None:
         """Test mapping index lookup functionality."""
         assert self.controller.get_mapping_index(self.mapping1) == 0
@@ -1,94 +1,106 @@
 """Tests for TUI widgets."""
 
+from typing import Callable, Optional, Sequence, Tuple
+
+import pytest
+
 from git_autosquash.blame_analyzer import HunkTargetMapping
 from git_autosquash.hunk_parser import DiffHunk
 from git_autosquash.tui.widgets import DiffViewer, HunkMappingWidget, ProgressIndicator
 
-
-class TestHunkMappingWidget:
-    """Test cases for HunkMappingWidget."""
-
-    def test_init(self) -> None:
-        """Test HunkMappingWidget initialization."""
+_LANG_CASES: Tuple[Tuple[str, str], ...] = (
+    ("test.py", "python"),
+    ("app.js", "javascript"),
+    ("component.tsx", "tsx"),
+    ("styles.css", "css"),
+    ("config.json", "json"),
+    ("data.yaml", "yaml"),
+    ("script.sh", "bash"),
+    ("README.md", "markdown"),
+    ("unknown.xyz", "text"),
+)
+
+
+@pytest.fixture(scope="module")
+def viewer() -> DiffViewer:
+    """DiffViewer shared by the stateless language-detection tests."""
+    return DiffViewer()
+
+
+@pytest.fixture(scope="module")
+def make_mapping() -> Callable[..., HunkTargetMapping]:
+    """Factory building a HunkTargetMapping around a DiffHunk."""
+
+    def _make(
+        file_path: str,
+        old_start: int,
+        old_count: int,
+        new_start: int,
+        new_count: int,
+        lines: Sequence[str] = (),
+        target: Optional[str] = "abc123",
+        confidence: str = "high",
+    ) -> HunkTargetMapping:
         hunk = DiffHunk(
-            file_path="test.py",
-            old_start=5,
-            old_count=2,
-            new_start=5,
-            new_count=3,
-            lines=["@@ -5,2 +5,3 @@", " line 1", "+added line", " line 2"],
+            file_path=file_path,
+            old_start=old_start,
+            old_count=old_count,
+            new_start=new_start,
+            new_count=new_count,
+            lines=list(lines),
             context_before=[],
             context_after=[],
         )
-
-        mapping = HunkTargetMapping(
-            hunk=hunk, target_commit="abc123", confidence="high", blame_info=[]
+        return HunkTargetMapping(
+            hunk=hunk, target_commit=target, confidence=confidence, blame_info=[]
         )
 
-        widget = HunkMappingWidget(mapping)
+    return _make
 
-        assert widget.mapping is mapping
-        assert widget.selected is False
-        assert widget.approved is False  # Default to unapproved for safety
-        assert widget.ignored is False  # Default to not ignored
 
-    def test_format_hunk_range(self) -> None:
-        """Test hunk range formatting."""
-        hunk = DiffHunk(
-            file_path="test.py",
-            old_start=10,
-            old_count=5,
-            new_start=12,
-            new_count=7,
-            lines=[],
-            context_before=[],
-            context_after=[],
-        )
+class TestHunkMappingWidget:
+    """Test cases for HunkMappingWidget."""
 
-        mapping = HunkTargetMapping(
-            hunk=hunk, target_commit="def456", confidence="medium", blame_info=[]
+    @pytest.mark.parametrize(
+        "hunk_range,target_commit,confidence,expected_range",
+        [
+            ((5, 2, 5, 3), "abc123", "high", "-5,2 +5,3"),
+            ((10, 5, 12, 7), "def456", "medium", "-10,5 +12,7"),
+            ((0, 0, 1, 10), None, "low", "-0,0 +1,10"),
+        ],
+        ids=["modified", "offset-range", "no-target-commit"],
+    )
+    def test_init(
+        self,
+        make_mapping: Callable[..., HunkTargetMapping],
+        hunk_range: Tuple[int, int, int, int],
+        target_commit: Optional[str],
+        confidence: str,
+        expected_range: str,
+    ) -> None:
+        """Test HunkMappingWidget initialization, range and target display."""
+        mapping = make_mapping(
+            "test.py", *hunk_range, target=target_commit, confidence=confidence
         )
 
         widget = HunkMappingWidget(mapping)
-        result = widget._format_hunk_range()
-
-        assert result == "-10,5 +12,7"
-
-    def test_no_target_commit(self) -> None:
-        """Test widget with no target commit."""
-        hunk = DiffHunk(
-            file_path="new_file.py",
-            old_start=0,
-            old_count=0,
-            new_start=1,
-            new_count=10,
-            lines=[],
-            context_before=[],
-            context_after=[],
-        )
-
-        mapping = HunkTargetMapping(
-            hunk=hunk, target_commit=None, confidence="low", blame_info=[]
-        )
 
-        widget = HunkMappingWidget(mapping)
-        assert widget.mapping.target_commit is None
+        assert widget.mapping is mapping
+        assert widget.mapping.target_commit == target_commit
+        assert widget.selected is False
+        assert widget.approved is False  # Default to unapproved for safety
+        assert widget.ignored is False  # Default to not ignored
+        assert widget._format_hunk_range() == expected_range
 
-    def test_ignore_state(self) -> None:
+    def test_ignore_state(self, make_mapping: Callable[..., HunkTargetMapping]) -> None:
         """Test widget ignore state functionality."""
-        hunk = DiffHunk(
-            file_path="test.py",
-            old_start=5,
-            old_count=2,
-            new_start=5,
-            new_count=3,
-            lines=["@@ -5,2 +5,3 @@", " line 1", "+added line", " line 2"],
-            context_before=[],
-            context_after=[],
-        )
-
-        mapping = HunkTargetMapping(
-            hunk=hunk, target_commit="abc123", confidence="high", blame_info=[]
+        mapping = make_mapping(
+            "test.py",
+            5,
+            2,
+            5,
+            3,
+            lines=("@@ -5,2 +5,3 @@", " line 1", "+added line", " line 2"),
         )
 
         widget = HunkMappingWidget(mapping)
@@ -117,31 +129,17 @@ class TestDiffViewer:
         viewer = DiffViewer()
         assert viewer._current_hunk is None
 
-    def test_get_language_from_file(self) -> None:
+    @pytest.mark.parametrize(
+        "file_path,expected", _LANG_CASES, ids=[case[0] for case in _LANG_CASES]
+    )
+    def test_get_language_from_file(
+        self, viewer: DiffViewer, file_path: str, expected: str
+    ) -> None:
         """Test language detection from file extensions."""
-        viewer = DiffViewer()
+        assert viewer._get_language_from_file(file_path) == expected
 
-        test_cases = [
-            ("test.py", "python"),
-            ("app.js", "javascript"),
-            ("component.tsx", "tsx"),
-            ("styles.css", "css"),
-            ("config.json", "json"),
-            ("data.yaml", "yaml"),
-            ("script.sh", "bash"),
-            ("README.md", "markdown"),
-            ("unknown.xyz", "text"),
-        ]
-
-        for file_path, expected_language in test_cases:
-            result = viewer._get_language_from_file(file_path)
-            assert result == expected_language, (
-                f"Expected {expected_language} for {file_path}, got {result}"
-            )
-
-    def test_get_language_from_file_no_extension(self) -> None:
+    def test_get_language_from_file_no_extension(self, viewer: DiffViewer) -> None:
         """Test language detection for files without extensions."""
-        viewer = DiffViewer()
         result = viewer._get_language_from_file("Makefile")
         assert result == "text"
 
@@ -176,53 +174,38 @@ class TestProgressIndicator:
         assert indicator.approved_count == 0
         assert indicator.ignored_count == 0
 
-    def test_format_progress_initial(self) -> None:
-        """Test initial progress formatting."""
-        indicator = ProgressIndicator(5)
-        result = indicator._format_progress()
-
-        assert result == "Progress: 0/5 selected  (0%)"
-
-    def test_format_progress_partial(self) -> None:
-        """Test partial progress formatting."""
-        indicator = ProgressIndicator(8)
-        indicator.approved_count = 3
-        result = indicator._format_progress()
-
-        assert result == "Progress: 3/8 selected (3 squash) (38%)"
-
-    def test_format_progress_complete(self) -> None:
-        """Test complete progress formatting."""
-        indicator = ProgressIndicator(4)
-        indicator.approved_count = 4
-        result = indicator._format_progress()
-
-        assert result == "Progress: 4/4 selected (4 squash) (100%)"
-
-    def test_format_progress_zero_total(self) -> None:
-        """Test progress formatting with zero total."""
-        indicator = ProgressIndicator(0)
-        result = indicator._format_progress()
-
-        assert result == "Progress: 0/0 selected  (0%)"
-
-    def test_format_progress_with_ignored(self) -> None:
-        """Test progress formatting with ignored hunks."""
-        indicator = ProgressIndicator(10)
-        indicator.approved_count = 3
-        indicator.ignored_count = 2
-        result = indicator._format_progress()
-
-        assert result == "Progress: 5/10 selected (3 squash, 2 ignore) (50%)"
-
-    def test_format_progress_only_ignored(self) -> None:
-        """Test progress formatting with only ignored hunks."""
-        indicator = ProgressIndicator(5)
-        indicator.approved_count = 0
-        indicator.ignored_count = 2
-        result = indicator._format_progress()
-
-        assert result == "Progress: 2/5 selected (2 ignore) (40%)"
+    @pytest.mark.parametrize(
+        "total,approved,ignored,expected",
+        [
+            (5, 0, 0, "Progress: 0/5 selected  (0%)"),
+            (8, 3, 0, "Progress: 3/8 selected (3 squash) (38%)"),
+            (4, 4, 0, "Progress: 4/4 selected (4 squash) (100%)"),
+            (0, 0, 0, "Progress: 0/0 selected  (0%)"),
+            (10, 3, 2, "Progress: 5/10 selected (3 squash, 2 ignore) (50%)"),
+            (5, 0, 2, "Progress: 2/5 selected (2 ignore) (40%)"),
+            (7, 2, 0, "Progress: 2/7 selected (2 squash) (29%)"),
+            (8, 1, 0, "Progress: 1/8 selected (1 squash) (13%)"),
+        ],
+        ids=[
+            "initial",
+            "partial",
+            "complete",
+            "zero-total",
+            "with-ignored",
+            "only-ignored",
+            "rounding",
+            "half-rounds-up",
+        ],
+    )
+    def test_format_progress(
+        self, total: int, approved: int, ignored: int, expected: str
+    ) -> None:
+        """Test progress formatting across selection states."""
+        indicator = ProgressIndicator(total)
+        indicator.approved_count = approved
+        indicator.ignored_count = ignored
+
+        assert indicator._format_progress() == expected
 
     def test_update_progress(self) -> None:
         """Test updating progress."""
@@ -234,12 +217,3 @@ class TestProgressIndicator:
         # Update progress (test the internal state change)
         indicator.approved_count = 3
         assert indicator.approved_count == 3
-
-    def test_progress_percentage_rounding(self) -> None:
-        """Test that progress percentage is rounded correctly."""
-        indicator = ProgressIndicator(7)
-        indicator.approved_count = 2
-        result = indicator._format_progress()
-
-        # 2/7 = 28.57..., should round to 29%
-        assert result == "Progress: 2/7 selected (2 squash) (29%)"
@@ -1,29 +1,90 @@
 """Base fixtures for TUI integration tests."""
 
+from operator import attrgetter
+
 import pytest
-from typing import List
-from unittest.mock import MagicMock, patch
+from typing import Dict, List, Optional, Sequence, Tuple
+from unittest.mock import patch
 
 from git_autosquash.git_ops import GitOps
 from git_autosquash.hunk_parser import DiffHunk
 from git_autosquash.hunk_target_resolver import HunkTargetMapping, TargetingMethod
-from git_autosquash.commit_history_analyzer import CommitHistoryAnalyzer, CommitInfo
+from git_autosquash.commit_history_analyzer import CommitInfo
+from git_autosquash import batch_git_ops
 from git_autosquash.batch_git_ops import BatchCommitInfo
 
 
-@pytest.fixture
-def mock_git_ops():
-    """Create a mock GitOps instance with realistic behavior."""
-    git_ops = MagicMock(spec=GitOps)
-    git_ops.repo_path = "/test/repo"
-    git_ops._run_git_command.return_value = (True, "test output")
-    return git_ops
+class _GitOpsStub:
+    """Minimal GitOps stand-in; far cheaper to build than a specced MagicMock."""
+
+    def __init__(self) -> None:
+        self.repo_path = "/test/repo"
+
+    def _run_git_command(self, *args: str) -> Tuple[bool, str]:
+        return True, "test output"
+
+
+class _BatchOpsStub:
+    """BatchGitOperations stand-in serving preloaded commit info."""
+
+    def __init__(self, commit_info: Dict[str, BatchCommitInfo]) -> None:
+        self._commit_info = commit_info
+
+    def batch_load_commit_info(
+        self, commit_hashes: List[str]
+    ) -> Dict[str, BatchCommitInfo]:
+        return {
+            h: self._commit_info[h] for h in commit_hashes if h in self._commit_info
+        }
+
+
+class _BranchCommitsStub:
+    """BatchGitOperations stand-in returning a fixed branch history."""
+
+    def __init__(self, branch_commits: Sequence[str]) -> None:
+        self._branch_commits = tuple(branch_commits)
+
+    def get_branch_commits(self) -> List[str]:
+        return list(self._branch_commits)
+
+
+class _CommitHistoryAnalyzerStub:
+    """CommitHistoryAnalyzer stand-in returning fixed suggestions.
+
+    Tests can replace get_commit_suggestions on an instance to change them.
+    """
+
+    def __init__(
+        self,
+        git_ops: _GitOpsStub,
+        merge_base: str,
+        commits: Sequence[CommitInfo],
+        batch_commit_info: Dict[str, BatchCommitInfo],
+    ) -> None:
+        self.git_ops = git_ops
+        self.merge_base = merge_base
+        self.batch_ops = _BatchOpsStub(batch_commit_info)
+        self._suggestions = list(commits[:3])  # First 3 commits as suggestions
+
+    def get_commit_suggestions(
+        self, strategy: object, target_file: Optional[str] = None
+    ) -> List[CommitInfo]:
+        return list(self._suggestions)
 
 
 @pytest.fixture
-def sample_commits() -> List[CommitInfo]:
-    """Create sample commit data for testing."""
-    return [
+def mock_git_ops() -> _GitOpsStub:
+    """Create a stub GitOps instance with realistic behavior."""
+    return _GitOpsStub()
+
+
+@pytest.fixture(scope="session")
+def sample_commits() -> Tuple[CommitInfo, ...]:
+    """Create sample commit data for testing.
+
+    Session-scoped and returned as a tuple; tests must not mutate the commits.
+    """
+    return (
         CommitInfo(
             commit_hash="d59d269184f1f320a1e4d31bddde6440cceae7e1",
             short_hash="d59d2691",
@@ -60,13 +121,16 @@ def sample_commits() -> List[CommitInfo]:
             is_merge=True,
             files_touched=None,
         ),
-    ]
+    )
 
 
-@pytest.fixture
-def sample_diff_hunks() -> List[DiffHunk]:
-    """Create sample diff hunks for testing."""
-    return [
+@pytest.fixture(scope="session")
+def sample_diff_hunks() -> Tuple[DiffHunk, ...]:
+    """Create sample diff hunks for testing.
+
+    Session-scoped and returned as a tuple; tests must not mutate the hunks.
+    """
+    return (
         DiffHunk(
             file_path="shared/runtime/pyexec.c",
             old_start=87,
@@ -133,7 +197,7 @@ def sample_diff_hunks() -> List[DiffHunk]:
             context_before=[],
             context_after=[],
         ),
-    ]
+    )
 
 
 @pytest.fixture
@@ -188,50 +252,47 @@ def mixed_mappings(
     return blame_matched_mappings + fallback_mappings
 
 
-@pytest.fixture
-def mock_commit_history_analyzer(mock_git_ops, sample_commits):
-    """Create a mock CommitHistoryAnalyzer with realistic behavior."""
-    analyzer = MagicMock(spec=CommitHistoryAnalyzer)
-    analyzer.git_ops = mock_git_ops
-    analyzer.merge_base = "b0fd0079f48bde7f12578823ef88c91f52757cff"
-
-    # Mock batch operations
-    mock_batch_ops = MagicMock()
-    mock_batch_ops.batch_load_commit_info.return_value = {
+@pytest.fixture(scope="session")
+def sample_batch_commit_info(sample_commits) -> Dict[str, BatchCommitInfo]:
+    """Batch-loaded commit info for sample_commits, keyed by commit hash."""
+    fields = attrgetter(
+        "commit_hash", "short_hash", "subject", "author", "timestamp", "is_merge"
+    )
+    return {
         commit.commit_hash: BatchCommitInfo(
-            commit_hash=commit.commit_hash,
-            short_hash=commit.short_hash,
-            subject=commit.subject,
-            author=commit.author,
-            timestamp=commit.timestamp,
-            is_merge=commit.is_merge,
-            parent_count=2 if commit.is_merge else 1,
+            *fields(commit), parent_count=2 if commit.is_merge else 1
         )
         for commit in sample_commits
     }
-    analyzer.git_ops.batch_ops = mock_batch_ops
 
-    # Mock commit suggestions
-    def get_suggestions(strategy, file_path=None):
-        return sample_commits[:3]  # Return first 3 commits as suggestions
 
-    analyzer.get_commit_suggestions.side_effect = get_suggestions
-    return analyzer
+@pytest.fixture
+def mock_commit_history_analyzer(
+    mock_git_ops, sample_commits, sample_batch_commit_info
+):
+    """Create a stub CommitHistoryAnalyzer with realistic behavior."""
+    return _CommitHistoryAnalyzerStub(
+        mock_git_ops,
+        "b0fd0079f48bde7f12578823ef88c91f52757cff",
+        sample_commits,
+        sample_batch_commit_info,
+    )
+
+
+_TERM_SIZES: Tuple[Tuple[int, int], ...] = ((80, 24), (120, 40), (100, 30))
 
 
-@pytest.fixture(params=[(80, 24), (120, 40), (100, 30)])
+@pytest.fixture(params=_TERM_SIZES, ids=[f"{w}x{h}" for w, h in _TERM_SIZES])
 def terminal_sizes(request):
     """Provide various terminal size configurations for testing."""
     return request.param
 
 
-@pytest.fixture
-def large_mappings_dataset(sample_commits) -> List[HunkTargetMapping]:
-    """Create a large dataset for performance testing."""
-    mappings = []
-
-    for i in range(50):
-        hunk = DiffHunk(
+@pytest.fixture(scope="session")
+def large_hunks_dataset() -> Tuple[DiffHunk, ...]:
+    """Create the hunks behind large_mappings_dataset once per session."""
+    return tuple(
+        DiffHunk(
             file_path=f"test_file_{i % 10}.py",
             old_start=i + 1,
             old_count=3,
@@ -247,7 +308,22 @@ def large_mappings_dataset(sample_commits) -> List[HunkTargetMapping]:
             context_before=[f"# Context before {i}"],
             context_after=[f"# Context after {i}"],
         )
+        for i in range(50)
+    )
+
+
+@pytest.fixture
+def large_mappings_dataset(
+    large_hunks_dataset, sample_commits
+) -> List[HunkTargetMapping]:
+    """Create a large dataset for performance testing.
+
+    Mappings are rebuilt per test because the TUI updates them in place when
+    the user picks a target; the hunks themselves are shared.
+    """
+    mappings = []
 
+    for i, hunk in enumerate(large_hunks_dataset):
         # Mix of blame matches and fallbacks
         if i % 3 == 0:  # Fallback scenario
             mapping = HunkTargetMapping(
@@ -277,21 +353,35 @@ def large_mappings_dataset(sample_commits) -> List[HunkTargetMapping]:
     return mappings
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="package", autouse=True)
 def disable_git_commands():
-    """Automatically disable real git commands for all tests."""
-    with patch("git_autosquash.git_ops.GitOps._run_git_command") as mock_git:
-        mock_git.return_value = (True, "mocked git output")
+    """Automatically disable real git commands for all tests.
+
+    Package-scoped so the patch is applied once for the TUI integration tests
+    and removed before tests outside this package run.
+    """
+    with patch.object(
+        GitOps, "_run_git_command", return_value=(True, "mocked git output")
+    ) as mock_git:
         yield mock_git
 
 
 @pytest.fixture
-def mock_batch_git_ops():
-    """Mock BatchGitOperations for performance testing."""
-    with patch("git_autosquash.batch_git_ops.BatchGitOperations") as mock_ops:
-        mock_instance = mock_ops.return_value
-        mock_instance.get_branch_commits.return_value = [
+def mock_batch_git_ops(monkeypatch):
+    """Replace BatchGitOperations with a stub serving a fixed branch history.
+
+    Every BatchGitOperations(...) call made during the test returns the
+    stub; monkeypatch restores the class afterwards. The swap is per test
+    rather than per session so that tests which do not request the fixture,
+    inside or outside this package, always see the real class.
+    """
+    stub = _BranchCommitsStub(
+        [
             "d59d269184f1f320a1e4d31bddde6440cceae7e1",
             "384653e92f39114982d7afb1429956b954ab1234",
         ]
-        yield mock_instance
+    )
+    monkeypatch.setattr(
+        batch_git_ops, "BatchGitOperations", lambda git_ops, merge_base: stub
+    )
+    return stub
@@ -1,14 +1,15 @@
 """Helper utilities for TUI integration testing."""
 
 import re
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 import pyte
+from textual.css.query import NoMatches
 from textual.pilot import Pilot
 
 
-@dataclass
+@dataclass(slots=True)
 class WidgetBounds:
     """Represents the bounds of a widget on screen."""
 
@@ -28,11 +29,12 @@ class TextualAssertions:
         pilot: Pilot, widget_id: str, timeout: float = 3.0
     ) -> None:
         """Assert that a widget with the given ID is visible on screen."""
+        selector = f"#{widget_id}"
         try:
-            widget = pilot.app.screen.query_one(f"#{widget_id}")
-        except Exception:
+            widget = pilot.app.screen.query_one(selector)
+        except NoMatches:
             # Fallback to app query if not found in screen
-            widget = pilot.app.query_one(f"#{widget_id}")
+            widget = pilot.app.query_one(selector)
         assert widget is not None, f"Widget with ID '{widget_id}' not found"
         assert widget.display, f"Widget '{widget_id}' is not displayed"
 
@@ -43,12 +45,10 @@ class TextualAssertions:
         """Assert that a button is positioned near the bottom of the screen."""
         # Look for buttons in the current screen, not the root app
         buttons = pilot.app.screen.query("Button")
-        target_button = None
-
-        for button in buttons:
-            if button_text in str(button.label):
-                target_button = button
-                break
+        # Labels are Text/Content; .plain skips rendering the markup
+        target_button = next(
+            (button for button in buttons if button_text in button.label.plain), None
+        )
 
         assert target_button is not None, f"Button with text '{button_text}' not found"
 
@@ -64,9 +64,10 @@ class TextualAssertions:
     async def assert_radio_selected(pilot: Pilot, radio_label_pattern: str) -> None:
         """Assert that a radio button matching the pattern is selected."""
         radio_buttons = pilot.app.screen.query("RadioButton")
+        pattern = re.compile(radio_label_pattern)
 
         for radio in radio_buttons:
-            if re.search(radio_label_pattern, str(radio.label)):
+            if pattern.search(str(radio.label)):
                 assert radio.value, (
                     f"Radio button matching '{radio_label_pattern}' is not selected"
                 )
@@ -80,20 +81,27 @@ class TextualAssertions:
         # Get all visible text widgets from current screen
         text_widgets = pilot.app.screen.query("Static")
 
-        found = False
-        for widget in text_widgets:
-            if hasattr(widget, "renderable") and text in str(widget.renderable):
-                found = True
-                break
-
-        assert found, f"Text '{text}' not found on screen"
+        def contains_text(widget: Any) -> bool:
+            # Textual 2+ exposes the source as `content`; older releases as `renderable`
+            source = getattr(widget, "content", None)
+            if source is None:
+                source = getattr(widget, "renderable", None)
+            if source is None:
+                return False
+            if isinstance(source, str):
+                return text in source
+            return text in str(source)
+
+        assert any(contains_text(widget) for widget in text_widgets), (
+            f"Text '{text}' not found on screen"
+        )
 
     @staticmethod
     async def get_progress_text(pilot: Pilot) -> Optional[str]:
         """Extract the progress text from screen."""
         try:
             description_widget = pilot.app.screen.query_one("#screen-description")
-        except Exception:
+        except NoMatches:
             description_widget = pilot.app.query_one("#screen-description")
         if description_widget and hasattr(description_widget, "renderable"):
             return str(description_widget.renderable)
@@ -106,40 +114,55 @@ class PyteScreenAnalyzer:
     def __init__(self, width: int = 80, height: int = 24):
         self.screen = pyte.Screen(width, height)
         self.stream = pyte.ByteStream(self.screen)
+        # Rendered rows, rebuilt lazily after new output is fed
+        self._display_cache: Optional[List[str]] = None
 
     def feed_terminal_output(self, output: bytes) -> None:
         """Feed terminal output to the screen."""
         self.stream.feed(output)
+        self._display_cache = None
+
+    def _lines(self) -> List[str]:
+        """Get the rendered screen rows, cached until the next feed."""
+        if self._display_cache is None:
+            self._display_cache = list(self.screen.display)
+        return self._display_cache
 
-    def find_text_position(self, text: str) -> List[Tuple[int, int]]:
-        """Find all positions where text appears on screen."""
+    def find_text_position(
+        self, text: str, overlap: bool = False
+    ) -> List[Tuple[int, int]]:
+        """Find all positions where text appears on screen.
+
+        Matches are non-overlapping unless overlap is True.
+        """
         positions = []
+        step = 1 if overlap else max(1, len(text))
 
-        for row_idx, line in enumerate(self.screen.display):
-            line_text = "".join(char.data for char in line)
+        for row_idx, line_text in enumerate(self._lines()):
             col_idx = 0
             while True:
                 found_idx = line_text.find(text, col_idx)
                 if found_idx == -1:
                     break
                 positions.append((row_idx, found_idx))
-                col_idx = found_idx + 1
+                col_idx = found_idx + step
 
         return positions
 
     def get_text_at_position(self, row: int, col: int, length: int = None) -> str:
         """Get text at a specific position."""
-        if row >= len(self.screen.display) or row < 0:
+        lines = self._lines()
+        if row >= len(lines) or row < 0:
             return ""
 
-        line = self.screen.display[row]
+        line = lines[row]
         if col >= len(line) or col < 0:
             return ""
 
         if length is None:
-            return "".join(char.data for char in line[col:])
+            return line[col:]
         else:
-            return "".join(char.data for char in line[col : col + length])
+            return line[col : col + length]
 
     def get_widget_bounds(self, widget_identifier: str) -> Optional[WidgetBounds]:
         """
@@ -179,11 +202,14 @@ class PyteScreenAnalyzer:
             if bounds:
                 bounds_list.append(bounds)
 
-        # Check for overlaps
-        for i, bounds1 in enumerate(bounds_list):
-            for j, bounds2 in enumerate(bounds_list[i + 1 :], i + 1):
-                if self._bounds_overlap(bounds1, bounds2):
-                    return False
+        # Sweep top to bottom, comparing each widget only with those whose
+        # rows it can still share
+        active: List[WidgetBounds] = []
+        for bounds in sorted(bounds_list, key=lambda b: (b.top, b.left)):
+            active = [other for other in active if other.bottom > bounds.top]
+            if any(self._bounds_overlap(bounds, other) for other in active):
+                return False
+            active.append(bounds)
 
         return True
 
@@ -198,7 +224,7 @@ class PyteScreenAnalyzer:
 
     def get_screen_content(self) -> List[str]:
         """Get all screen content as list of strings."""
-        return ["".join(char.data for char in line) for line in self.screen.display]
+        return list(self._lines())
 
     def assert_text_at_position(self, row: int, col: int, expected_text: str) -> None:
         """Assert that specific text appears at given coordinates."""
@@ -210,15 +236,12 @@ class PyteScreenAnalyzer:
 
     def get_color_at_position(self, row: int, col: int) -> Optional[str]:
         """Get ANSI color information at a specific position."""
-        if (
-            row >= len(self.screen.display)
-            or row < 0
-            or col >= len(self.screen.display[row])
-            or col < 0
-        ):
+        lines = self._lines()
+        if row >= len(lines) or row < 0 or col >= len(lines[row]) or col < 0:
             return None
 
-        char = self.screen.display[row][col]
+        # display only holds text; attributes live on the buffer's Char cells
+        char = self.screen.buffer[row][col]
         # Return simplified color info - in real implementation you'd parse ANSI codes
         if hasattr(char, "fg"):
             return f"fg_{char.fg}"
@@ -240,6 +263,8 @@ class MockDataGenerator:
         )
 
         mappings = []
+        # Candidates don't depend on the hunk; each mapping gets its own copy
+        fallback_candidates = [f"candidate_{j:08d}" for j in range(3)]
 
         # Create blame matches
         for i in range(blame_count):
@@ -291,7 +316,7 @@ class MockDataGenerator:
                 confidence="low",
                 blame_info=[],
                 targeting_method=TargetingMethod.FALLBACK_EXISTING_FILE,
-                fallback_candidates=[f"candidate_{j:08d}" for j in range(3)],
+                fallback_candidates=list(fallback_candidates),
                 needs_user_selection=True,
             )
             mappings.append(mapping)
@@ -325,27 +350,35 @@ def capture_textual_output(app_output: str) -> bytes:
     return app_output.encode("utf-8")
 
 
-async def simulate_user_workflow(pilot: Pilot, actions: List[Dict[str, Any]]) -> None:
+_WORKFLOW_ACTIONS: Dict[str, Callable[[Pilot, Dict[str, Any]], Awaitable[Any]]] = {
+    "key": lambda pilot, action: pilot.press(action["key"]),
+    "click": lambda pilot, action: pilot.click(action["selector"]),
+    "wait": lambda pilot, action: pilot.pause(action.get("duration", 0.1)),
+    "assert_text": lambda pilot, action: TextualAssertions.assert_text_in_screen(
+        pilot, action["text"]
+    ),
+    "assert_visible": lambda pilot, action: TextualAssertions.assert_widget_visible(
+        pilot, action["widget_id"]
+    ),
+}
+
+
+async def simulate_user_workflow(
+    pilot: Pilot, actions: List[Dict[str, Any]], inter_action_delay: float = 0.0
+) -> None:
     """
     Simulate a complete user workflow with the TUI.
 
     Args:
         pilot: Textual pilot for controlling the app
         actions: List of actions to perform, each with 'type' and parameters
+        inter_action_delay: Seconds to pause after each action; 0 disables it
     """
     for action in actions:
-        action_type = action["type"]
-
-        if action_type == "key":
-            await pilot.press(action["key"])
-        elif action_type == "click":
-            await pilot.click(action["selector"])
-        elif action_type == "wait":
-            await pilot.pause(action.get("duration", 0.1))
-        elif action_type == "assert_text":
-            await TextualAssertions.assert_text_in_screen(pilot, action["text"])
-        elif action_type == "assert_visible":
-            await TextualAssertions.assert_widget_visible(pilot, action["widget_id"])
-
-        # Small pause between actions for realism
-        await pilot.pause(0.05)
+        handler = _WORKFLOW_ACTIONS.get(action["type"])
+        if handler is not None:
+            await handler(pilot, action)
+
+        # Optional pause between actions for pacing-sensitive tests
+        if inter_action_delay:
+            await pilot.pause(inter_action_delay)
@@ -356,21 +356,22 @@ class TestErrorAndEdgeCaseScenarios:
         )
 
         # Mock analyzer to return commit with very long subject
-        mock_commit_history_analyzer.get_commit_suggestions.return_value = [
-            type(
-                "MockCommit",
-                (),
-                {
-                    "commit_hash": "abcd1234",
-                    "short_hash": "abcd1234",
-                    "subject": "This is an extremely long commit message that goes on and on and on and should definitely be truncated by the UI to prevent layout issues and ensure readability for users who are trying to select the appropriate target commit for their changes",
-                    "author": "Long Winded Author",
-                    "timestamp": 1756174372,
-                    "is_merge": False,
-                    "files_touched": ["test.py"],
-                },
-            )()
-        ]
+        long_subject_commit = type(
+            "MockCommit",
+            (),
+            {
+                "commit_hash": "abcd1234",
+                "short_hash": "abcd1234",
+                "subject": "This is an extremely long commit message that goes on and on and on and should definitely be truncated by the UI to prevent layout issues and ensure readability for users who are trying to select the appropriate target commit for their changes",
+                "author": "Long Winded Author",
+                "timestamp": 1756174372,
+                "is_merge": False,
+                "files_touched": ["test.py"],
+            },
+        )()
+        mock_commit_history_analyzer.get_commit_suggestions = (
+            lambda strategy, target_file=None: [long_subject_commit]
+        )
 
         app = EnhancedAutoSquashApp(
             [long_message_mapping], mock_commit_history_analyzer